@@ -3,11 +3,10 @@
 import math
 import datetime
 
-import pytz
-
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Callable, List, Optional
+from zoneinfo import ZoneInfo
 
 
 class VietnamMarketConstant:
@@ -15,7 +14,7 @@ class VietnamMarketConstant:
     UNIT_PRICE = 1000
     """Price unit of the Vietnam Dong"""
 
-    TIMEZONE = pytz.timezone('Asia/Ho_Chi_Minh')
+    TIMEZONE = ZoneInfo('Asia/Ho_Chi_Minh')
     """Timezone of the Vietnam Market"""
 
     HSX = 'HSX'
@@ -54,6 +53,17 @@ class VietnamMarketConstant:
     NOTE: tick size is 0.01 for warrants & exchange-traded funds (ETF)"""
 
 
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _microseconds_of_day(value) -> int:
+    """Returns the wall-clock time of a datetime.time/datetime as microseconds since midnight."""
+    return (
+        (value.hour * 3600 + value.minute * 60 + value.second) * 1_000_000
+        + value.microsecond
+    )
+
+
 class AbstractTradingSession:
     """Trading session may vary by exchange"""
 
@@ -67,14 +77,23 @@ class AbstractTradingSession:
         self.start = start_time
         self.end = end_time
         self.effective_day = effective_day
+        self._weekday_mask = sum(1 << day for day in set(effective_day))
         self.timezone = timezone
+        # session bounds as microseconds since midnight, plus the UTC offset when
+        # the timezone is fixed, so the common queries need no datetime.combine
+        self._start_us = _microseconds_of_day(start_time)
+        self._end_us = _microseconds_of_day(end_time)
+        self._utcoffset_us = (
+            timezone.utcoffset(None) // _ONE_MICROSECOND
+            if isinstance(timezone, datetime.timezone) else None
+        )
 
     def is_current(self, given_datetime: datetime.datetime):
         """Return True if the trading session is at the given datetime."""
-        if given_datetime.weekday() not in self.effective_day:
+        if not (self._weekday_mask >> given_datetime.weekday()) & 1:
             return False
 
-        return self.start <= given_datetime.time() <= self.end
+        return self._start_us <= _microseconds_of_day(given_datetime) <= self._end_us
 
     # TODO: considering how to compare from the previous day ATC session (T and T+1 day)
     def get_total_seconds_from(
@@ -98,6 +117,23 @@ class AbstractTradingSession:
             - datetime.datetime.combine(given_datetime.date(), time_point, tzinfo=self.timezone)
         ).total_seconds()
 
+    def _get_total_seconds_from_us(
+        self,
+        time_point: datetime.time,
+        time_point_us: int,
+        given_datetime: datetime.datetime
+    ) -> float:
+        """Same as get_total_seconds_from with the time_point precomputed in microseconds."""
+        delta_us = _microseconds_of_day(given_datetime) - time_point_us
+        if given_datetime.tzinfo is self.timezone:
+            # same tzinfo (or both naive): datetimes subtract by wall time
+            return delta_us / 1_000_000
+
+        given_offset = given_datetime.utcoffset()
+        if self._utcoffset_us is None or given_offset is None:
+            return self.get_total_seconds_from(time_point, given_datetime)
+        return (delta_us - given_offset // _ONE_MICROSECOND + self._utcoffset_us) / 1_000_000
+
     def get_total_seconds_from_start(
         self,
         given_datetime: datetime.datetime
@@ -112,7 +148,7 @@ class AbstractTradingSession:
             A positive number if the session has started (given_datetime > start),
             a negative number otherwise.
         """
-        return self.get_total_seconds_from(self.start, given_datetime)
+        return self._get_total_seconds_from_us(self.start, self._start_us, given_datetime)
 
     def get_total_seconds_from_end(
         self,
@@ -128,7 +164,7 @@ class AbstractTradingSession:
             A positive number if the session has ended (given_datetime > end),
             a negative number otherwise.
         """
-        return self.get_total_seconds_from(self.end, given_datetime)
+        return self._get_total_seconds_from_us(self.end, self._end_us, given_datetime)
 
 
 class VietNamTradingSession:
@@ -258,6 +294,14 @@ class Exchange:
         return self.tick_size_function(ticker_symbol, price_point)
 
 
+_EXCHANGE_TIMEZONE = datetime.timezone(datetime.timedelta(hours=7))
+"""Fixed UTC+7 offset shared by every exchange trading session"""
+
+_TICK_SIZE_0_01 = Decimal("0.01")
+_TICK_SIZE_0_05 = Decimal("0.05")
+_TICK_SIZE_0_1 = Decimal("0.1")
+
+
 def get_hsx_tick_size(
     ticker_symbol: str,
     price_point: Decimal,
@@ -272,18 +316,15 @@ def get_hsx_tick_size(
         A tick size in Decimal.
     """
     # tick size is 0.01 for warrants & exchange-traded funds (ETF)
-    if len(ticker_symbol) == 8 and ticker_symbol[0] in ["C", "E", "F"]:
-        return Decimal(".01")
+    if len(ticker_symbol) == 8 and ticker_symbol[0] in ("C", "E", "F"):
+        return _TICK_SIZE_0_01
 
-    hsx_tick_size_info = {
-        (0, 10): Decimal("0.01"),
-        (10, 50): Decimal("0.05"),
-        (50, math.inf): Decimal("0.1"),
-    }
-    # tick sizes of stocks in HSX vary by price
-    for (lower_bound, upper_bound), tick_size in hsx_tick_size_info.items():
-        if lower_bound <= price_point < upper_bound:
-            return tick_size
+    # tick sizes of stocks in HSX vary by price: [0, 10), [10, 50), [50, inf)
+    if price_point < 10:
+        return _TICK_SIZE_0_01 if price_point >= 0 else None
+    if price_point < 50:
+        return _TICK_SIZE_0_05
+    return _TICK_SIZE_0_1
 
 
 HSX = Exchange(
@@ -292,33 +333,33 @@ HSX = Exchange(
     before_trading_session=AbstractTradingSession(
         start_time=datetime.time(0, 0, 0),
         end_time=datetime.time(8, 59, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     ato_session=AbstractTradingSession(
         start_time=datetime.time(9, 0, 0),
         end_time=datetime.time(9, 15, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     lo_session=AbstractTradingSession(
         start_time=datetime.time(9, 15, 0),
         end_time=datetime.time(14, 30, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     noon_break=AbstractTradingSession(
         start_time=datetime.time(11, 30, 0),
         end_time=datetime.time(13, 0, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     atc_session=AbstractTradingSession(
         start_time=datetime.time(14, 30, 0),
         end_time=datetime.time(14, 45, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     plo_session=None,
     after_trading_session=AbstractTradingSession(
         start_time=datetime.time(14, 45, 1),
         end_time=datetime.time(23, 59, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     trading_unit=100,
     daily_trading_limit=0.07,
@@ -331,37 +372,37 @@ HNX = Exchange(
     before_trading_session=AbstractTradingSession(
         start_time=datetime.time(0, 0, 0),
         end_time=datetime.time(8, 59, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     ato_session=None,
     lo_session=AbstractTradingSession(
         start_time=datetime.time(9, 0, 0),
         end_time=datetime.time(14, 30, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     noon_break=AbstractTradingSession(
         start_time=datetime.time(11, 30, 0),
         end_time=datetime.time(13, 0, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     atc_session=AbstractTradingSession(
         start_time=datetime.time(14, 30, 0),
         end_time=datetime.time(14, 45, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     plo_session=AbstractTradingSession(
         start_time=datetime.time(14, 45, 0),
         end_time=datetime.time(15, 0, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     after_trading_session=AbstractTradingSession(
         start_time=datetime.time(15, 0, 1),
         end_time=datetime.time(23, 59, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     trading_unit=100,
     daily_trading_limit=0.1,
-    tick_size_function=lambda _, __: Decimal("0.1"),
+    tick_size_function=lambda _, __: _TICK_SIZE_0_1,
 )
 
 UPCOM = Exchange(
@@ -370,29 +411,29 @@ UPCOM = Exchange(
     before_trading_session=AbstractTradingSession(
         start_time=datetime.time(0, 0, 0),
         end_time=datetime.time(8, 59, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     ato_session=None,
     lo_session=AbstractTradingSession(
         start_time=datetime.time(9, 0, 0),
         end_time=datetime.time(15, 0, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     noon_break=AbstractTradingSession(
         start_time=datetime.time(11, 30, 0),
         end_time=datetime.time(13, 0, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     atc_session=None,
     plo_session=None,
     after_trading_session=AbstractTradingSession(
         start_time=datetime.time(15, 0, 1),
         end_time=datetime.time(23, 59, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     trading_unit=100,
     daily_trading_limit=0.15,
-    tick_size_function=lambda _, __: Decimal("0.1"),
+    tick_size_function=lambda _, __: _TICK_SIZE_0_1,
 )
 
 DS = Exchange(
@@ -401,35 +442,35 @@ DS = Exchange(
     before_trading_session=AbstractTradingSession(
         start_time=datetime.time(0, 0, 0),
         end_time=datetime.time(8, 44, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     ato_session=AbstractTradingSession(
         start_time=datetime.time(8, 45, 0),
         end_time=datetime.time(9, 0, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     lo_session=AbstractTradingSession(
         start_time=datetime.time(9, 0, 0),
         end_time=datetime.time(14, 30, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     noon_break=AbstractTradingSession(
         start_time=datetime.time(11, 30, 0),
         end_time=datetime.time(13, 0, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     atc_session=AbstractTradingSession(
         start_time=datetime.time(14, 30, 0),
         end_time=datetime.time(14, 45, 0),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     plo_session=None,
     after_trading_session=AbstractTradingSession(
         start_time=datetime.time(14, 45, 1),
         end_time=datetime.time(23, 59, 59),
-        timezone=datetime.timezone(datetime.timedelta(hours=7)),
+        timezone=_EXCHANGE_TIMEZONE,
     ),
     trading_unit=1,
     daily_trading_limit=0.07,
-    tick_size_function=lambda _, __: Decimal("0.1"),
+    tick_size_function=lambda _, __: _TICK_SIZE_0_1,
 )
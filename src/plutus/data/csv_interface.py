@@ -30,6 +30,9 @@ Usage:
     >>> results = processor.process_sample_data('tests/sample_data/')
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import attrgetter
 from typing import Dict, Any, List, Union
 from pathlib import Path
 
@@ -76,15 +79,21 @@ class CSVQuoteBatchProcessor:
         self.quote_reader = reader or CSVQuoteReader()
         self.metadata_reader = CSVMetadataReader()
 
-    def process_sample_data(self, directory_path: Union[str, Path]) -> Dict[str, Union[List[Quote], List]]:
+    def process_sample_data(
+        self, directory_path: Union[str, Path], max_workers: int = 1
+    ) -> Dict[str, Union[List[Quote], List]]:
         """Process all CSV files in a directory, routing to appropriate readers.
 
         This method automatically detects whether each CSV file is a quote file or
         metadata file and routes it to the correct reader. Quote files return
         List[Quote], metadata files return List[InstrumentMetadata|IndexConstituent|FutureContractCode].
 
+        The files are independent, so with max_workers > 1 they are read in
+        separate worker processes, as in CSVQuoteReader.read_csv_directory.
+
         Args:
             directory_path: Path to directory containing CSV files
+            max_workers: Number of worker processes; 1 reads in the calling process
 
         Returns:
             Dictionary mapping filenames to lists of parsed objects.
@@ -104,28 +113,37 @@ class CSVQuoteBatchProcessor:
         if not directory_path.is_dir():
             raise NotADirectoryError(f"Directory not found: {directory_path}")
 
-        results = {}
-
+        # Route each file to the appropriate reader based on file type
+        reads = []
         for csv_file in directory_path.glob("*.csv"):
-            filename = csv_file.stem
+            if csv_file.stem in ['quote_ticker', 'quote_vn30', 'quote_futurecontractcode']:
+                reads.append((csv_file, self.metadata_reader.read_metadata_file, 'metadata'))
+            else:
+                reads.append((csv_file, self.quote_reader.read_csv_file, 'quotes'))
 
-            # Route to appropriate reader based on file type
-            if filename in ['quote_ticker', 'quote_vn30', 'quote_futurecontractcode']:
-                # Metadata files
+        results = {}
+        if max_workers <= 1:
+            for csv_file, read, kind in reads:
                 try:
-                    results[csv_file.name] = self.metadata_reader.read_metadata_file(csv_file)
+                    results[csv_file.name] = read(csv_file)
                 except Exception as e:
-                    print(f"Warning: Failed to read metadata {csv_file.name}: {e}")
+                    print(f"Warning: Failed to read {kind} {csv_file.name}: {e}")
                     results[csv_file.name] = []
-            else:
-                # Quote files
+            return results
+
+        # spawn rather than fork: pyarrow keeps a thread pool in this process
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {executor.submit(read, csv_file): (csv_file, kind) for csv_file, read, kind in reads}
+            for future in as_completed(futures):
+                csv_file, kind = futures[future]
                 try:
-                    results[csv_file.name] = self.quote_reader.read_csv_file(csv_file)
+                    results[csv_file.name] = future.result()
                 except Exception as e:
-                    print(f"Warning: Failed to read quotes {csv_file.name}: {e}")
+                    print(f"Warning: Failed to read {kind} {csv_file.name}: {e}")
                     results[csv_file.name] = []
 
-        return results
+        # Keep the directory listing order regardless of completion order
+        return {csv_file.name: results[csv_file.name] for csv_file, _, _ in reads}
 
     def get_statistics(self, results: Dict[str, List]) -> Dict[str, Any]:
         """Generate statistics from processing results.
@@ -167,36 +185,33 @@ class CSVQuoteBatchProcessor:
         file_stats = {}
 
         for filename, data_list in results.items():
-            success = len(data_list) > 0
+            record_count = len(data_list)
+            success = record_count > 0
             if success:
                 successful_files += 1
             else:
                 failed_files += 1
 
-            # Determine if this is quote data or metadata
-            is_metadata = any(isinstance(item, (InstrumentMetadata, IndexConstituent, FutureContractCode))
-                            for item in data_list) if data_list else False
+            # Determine if this is quote data or metadata; each file is read by
+            # a single reader, so its first record tells the type of all of them
+            is_metadata = success and isinstance(
+                data_list[0], (InstrumentMetadata, IndexConstituent, FutureContractCode)
+            )
 
             # Count records
             if is_metadata:
-                total_metadata += len(data_list)
+                total_metadata += record_count
                 data_type = 'metadata'
-                # For metadata, count unique symbols
-                unique_symbols = len(set(
-                    item.ticker_symbol for item in data_list
-                    if hasattr(item, 'ticker_symbol')
-                )) if data_list else 0
             else:
                 # Quote data
-                total_quotes += len(data_list)
+                total_quotes += record_count
                 data_type = 'quote'
-                # For quotes, count unique ticker symbols
-                unique_symbols = len(set(
-                    q.ticker_symbol for q in data_list
-                )) if data_list else 0
+
+            # Count unique ticker symbols (every quote and metadata record has one)
+            unique_symbols = len(set(map(attrgetter('ticker_symbol'), data_list)))
 
             file_stats[filename] = {
-                'record_count': len(data_list),
+                'record_count': record_count,
                 'success': success,
                 'unique_symbols': unique_symbols,
                 'data_type': data_type
@@ -20,7 +20,66 @@ Usage:
 
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Optional
+import re
+
+# "YYYY-MM-DD", "YYYY-MM-DD HH:MM:SS" or "YYYY-MM-DD HH:MM:SS.ffffff" (1-6 fraction
+# digits, as accepted by %f); anything else falls back to strptime
+_TIMESTAMP_PATTERN = re.compile(
+    r'\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}:\d{2}(?:\.\d{1,6})?)?\Z',
+    re.ASCII,
+)
+
+# strptime layouts tried in order when the fast path does not match
+_TIMESTAMP_FORMATS = (
+    '%Y-%m-%d %H:%M:%S.%f',      # 2021-01-15 09:00:00.123456
+    '%Y-%m-%d %H:%M:%S',         # 2021-01-15 09:00:00
+    '%Y-%m-%d',                  # 2021-01-15
+)
+_DATE_FORMATS = (
+    '%Y-%m-%d',                  # 2023-06-15
+    '%Y-%m-%d %H:%M:%S',         # 2023-06-15 00:00:00
+)
+
+
+@lru_cache(maxsize=65536)
+def _decimal_from_str(value_str: str) -> Optional[Decimal]:
+    """Memoized body of CSVParserMixin.parse_decimal.
+
+    Prices sit on a small tick grid, so the same strings repeat across rows;
+    Decimal is immutable, so every row with the same string shares one value.
+    Callers pass a non-empty string; most cells carry no padding, so the strip
+    copy is only made when an end is whitespace.
+    """
+    if value_str[0].isspace() or value_str[-1].isspace():
+        value_str = value_str.strip()
+        if not value_str:
+            return None
+
+    try:
+        return Decimal(value_str)
+    except (ValueError, InvalidOperation):
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _int_from_str(value_str: str) -> Optional[int]:
+    """Memoized body of CSVParserMixin.parse_integer (quantities repeat like prices)."""
+    value_str = value_str.strip()
+    if not value_str:
+        return None
+
+    try:
+        return int(value_str)
+    except ValueError:
+        pass
+
+    try:
+        return int(float(value_str))  # Handle decimal strings
+    except (ValueError, TypeError, OverflowError):
+        # OverflowError: "inf" and values past float range ("1e999")
+        return None
 
 
 class CSVParserMixin:
@@ -57,13 +116,9 @@ class CSVParserMixin:
             >>> parser.parse_decimal("invalid")
             None
         """
-        if not value_str or value_str.strip() == '':
-            return None
-
-        try:
-            return Decimal(value_str.strip())
-        except (ValueError, InvalidOperation):
+        if not value_str:
             return None
+        return _decimal_from_str(value_str)
 
     def parse_integer(self, value_str: str) -> Optional[int]:
         """Parse string to integer for quantity fields.
@@ -88,13 +143,9 @@ class CSVParserMixin:
             >>> parser.parse_integer("")
             None
         """
-        if not value_str or value_str.strip() == '':
-            return None
-
-        try:
-            return int(float(value_str.strip()))  # Handle decimal strings
-        except (ValueError, TypeError):
+        if not value_str:
             return None
+        return _int_from_str(value_str)
 
     def parse_timestamp(self, timestamp_str: str) -> Optional[float]:
         """Parse datetime string to Unix timestamp for quote data.
@@ -123,19 +174,20 @@ class CSVParserMixin:
         if not timestamp_str:
             return None
 
-        # Try different timestamp formats
-        formats = [
-            '%Y-%m-%d %H:%M:%S.%f',      # 2021-01-15 09:00:00.123456
-            '%Y-%m-%d %H:%M:%S',         # 2021-01-15 09:00:00
-            '%Y-%m-%d',                  # 2021-01-15
-        ]
+        # Remove timezone info if present (e.g., "+07:00")
+        clean_str = timestamp_str.split('+')[0].strip()
+
+        # Fast path: the regex checks the string is one of the canonical layouts,
+        # which fromisoformat then parses in C without strptime's format handling
+        if _TIMESTAMP_PATTERN.match(clean_str):
+            try:
+                return datetime.fromisoformat(clean_str).timestamp()
+            except ValueError:
+                return None
 
-        for fmt in formats:
+        for fmt in _TIMESTAMP_FORMATS:
             try:
-                # Remove timezone info if present (e.g., "+07:00")
-                clean_str = timestamp_str.split('+')[0].strip()
-                dt = datetime.strptime(clean_str, fmt)
-                return dt.timestamp()
+                return datetime.strptime(clean_str, fmt).timestamp()
             except ValueError:
                 continue
 
@@ -165,18 +217,12 @@ class CSVParserMixin:
         if not date_str or date_str.strip() == '':
             return None
 
-        # Try different date formats
-        formats = [
-            '%Y-%m-%d',                  # 2023-06-15
-            '%Y-%m-%d %H:%M:%S',         # 2023-06-15 00:00:00
-        ]
+        # Remove timezone info if present
+        clean_str = date_str.split('+')[0].strip()
 
-        for fmt in formats:
+        for fmt in _DATE_FORMATS:
             try:
-                # Remove timezone info if present
-                clean_str = date_str.split('+')[0].strip()
-                dt = datetime.strptime(clean_str, fmt)
-                return dt.date()
+                return datetime.strptime(clean_str, fmt).date()
             except ValueError:
                 continue
 
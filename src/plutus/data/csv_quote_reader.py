@@ -23,14 +23,73 @@ Usage:
 """
 
 import csv
-from datetime import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache
 from decimal import Decimal, InvalidOperation
-from typing import List, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Iterator, Optional, TextIO, Tuple, Union
 from pathlib import Path
 
+from plutus.data.model.enums import QUOTE_DECIMAL_ATTRIBUTES, STRING_TO_QUOTETYPE_MAP
 from plutus.data.model.quote import Quote
 from plutus.data.csv_parser_mixin import CSVParserMixin
 
+# pyarrow is imported by the methods that use it, so importing this module
+# (and every reader built on it) does not pay pyarrow's import cost until a
+# file is first read columnar
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+# Layouts the parse_timestamp fast path accepts, without surrounding whitespace or
+# a UTC offset; the only ones _parse_timestamp_column hands to Arrow
+_CANONICAL_TIMESTAMP_REGEX = r'^\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2}(\.\d{1,6})?)?$'
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Integer strings Arrow casts exactly as int() parses them, within int64
+_PLAIN_INTEGER_REGEX = r'^-?\d{1,18}$'
+_UNIX_EPOCH = datetime(1970, 1, 1)
+# Range of the int64 quantity column in read_csv_file_columnar tables
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+_QUOTE_FIELD_NAMES = frozenset(STRING_TO_QUOTETYPE_MAP)
+# (ticker_symbols, timestamps, exchange_codes) of the rows the columnar path builds quotes for
+_QuoteLabels = Tuple[List[str], List[float], List[Optional[str]]]
+
+
+def _local_utc_offset(minute_start: Optional[int]) -> Optional[int]:
+    """Seconds to add to a naive wall-clock minute to get Unix time, as naive
+    datetime.timestamp() computes it in the local timezone.
+
+    Returns None when the offset changes within the minute or the time cannot
+    be converted, leaving those values to parse_timestamp.
+    """
+    if minute_start is None:
+        return None
+    try:
+        start = _UNIX_EPOCH + timedelta(seconds=minute_start)
+        offset = start.timestamp() - minute_start
+        if (start + timedelta(seconds=59)).timestamp() - (minute_start + 59) != offset:
+            return None
+    except (ValueError, OverflowError, OSError):
+        return None
+    return int(offset)
+
+
+@lru_cache(maxsize=65536)
+def _split_ticker_cell(raw_ticker: str) -> Optional[Tuple[str, Optional[str]]]:
+    """Memoized body of CSVQuoteReader._split_ticker.
+
+    A file holds few distinct tickers across many rows, so the quotes of one
+    ticker share a single symbol string instead of one copy per row.
+    """
+    ticker_symbol = raw_ticker.strip()
+    if not ticker_symbol:
+        return None
+    if ':' in ticker_symbol:
+        exchange_from_ticker, clean_ticker = ticker_symbol.split(':', 1)
+        return clean_ticker.strip(), exchange_from_ticker.strip() or None
+    return ticker_symbol, None
+
 
 class CSVQuoteReader(CSVParserMixin):
     """Reader for Quote CSV files (time-series market data).
@@ -119,6 +178,14 @@ class CSVQuoteReader(CSVParserMixin):
         """
         self.default_source = default_source
 
+        # quote_type -> field parser, so each row costs one lookup instead of
+        # a membership test per field family
+        self._field_parsers = {
+            **dict.fromkeys(self.CSV_TO_QUOTE_FIELD_MAP, self._parse_simple_field),
+            **dict.fromkeys(self.DEPTH_FIELDS, self._parse_depth_field),
+            **dict.fromkeys(self.MULTI_COLUMN_FIELDS, self._parse_multi_column_field),
+        }
+
     def read_csv_file(self, file_path: Union[str, Path]) -> List[Quote]:
         """Read a single quote CSV file and convert to Quote objects.
 
@@ -133,6 +200,107 @@ class CSVQuoteReader(CSVParserMixin):
             ValueError: If the file format is unsupported (e.g., metadata files)
         """
         file_path = Path(file_path)
+        quote_type = self._resolve_quote_type(file_path)
+
+        try:
+            # Files go through the columnar reader; it falls back to the row
+            # loop below for files it cannot take as-is
+            columnar_quotes = self._read_columnar(file_path, quote_type)
+            if columnar_quotes is not None:
+                return columnar_quotes
+
+            return list(self._iter_csv_rows(file_path, quote_type))
+
+        except Exception as e:
+            raise ValueError(f"Error reading CSV file {file_path}: {e}")
+
+    def iter_csv_file(self, file_path: Union[str, Path]) -> Iterator[Quote]:
+        """Yield the quotes of a single quote CSV file one row at a time.
+
+        Unlike read_csv_file, only the current row is held in memory, so files of
+        any size can be piped into a consumer. The file is parsed row by row,
+        which is slower than read_csv_file's columnar path for files that fit
+        in memory.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Iterator over the Quote objects read_csv_file would return, in order
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is unsupported (e.g., metadata files)
+        """
+        file_path = Path(file_path)
+        quote_type = self._resolve_quote_type(file_path)
+        return self._iter_csv_rows(file_path, quote_type)
+
+    def read_csv_stream(self, stream: TextIO, quote_type: str) -> List[Quote]:
+        """Read quote CSV data from an open text stream (e.g. io.StringIO).
+
+        The stream has no filename to detect the type from, so quote_type names
+        it. Rows are parsed like iter_csv_file's, one at a time.
+
+        Args:
+            stream: Text stream positioned at the CSV header
+            quote_type: Type of quote data (filename prefix, e.g. "quote_open")
+
+        Returns:
+            List of Quote objects parsed from the stream
+
+        Raises:
+            ValueError: If quote_type is unsupported or the data cannot be read
+        """
+        if not self._detect_quote_type(quote_type):
+            raise ValueError(f"Unsupported quote type: {quote_type}")
+
+        name = getattr(stream, 'name', '<stream>')
+        try:
+            return list(self._iter_csv_stream(stream, quote_type, name))
+        except Exception as e:
+            raise ValueError(f"Error reading CSV stream {name}: {e}")
+
+    def iter_csv_directory(self, directory_path: Union[str, Path]) -> Iterator[Quote]:
+        """Yield the quotes of every quote CSV file in a directory, file by file.
+
+        Streaming counterpart of read_csv_directory. Files whose type is not
+        supported are skipped; a file that fails part-way is reported and the
+        quotes already yielded from it are kept.
+
+        Args:
+            directory_path: Path to directory containing CSV files
+
+        Returns:
+            Iterator over the quotes of all files, in directory order
+
+        Raises:
+            NotADirectoryError: If the directory doesn't exist
+        """
+        directory_path = Path(directory_path)
+        if not directory_path.is_dir():
+            raise NotADirectoryError(f"Directory not found: {directory_path}")
+
+        return self._iter_directory_rows(directory_path)
+
+    def _iter_directory_rows(self, directory_path: Path) -> Iterator[Quote]:
+        """Generator body of iter_csv_directory."""
+        for csv_file in directory_path.glob("*.csv"):
+            quote_type = self._detect_quote_type(csv_file.stem)
+            if not quote_type:
+                continue
+            try:
+                yield from self._iter_csv_rows(csv_file, quote_type)
+            except Exception as e:
+                print(f"Warning: Failed to read quotes {csv_file.name}: {e}")
+
+    def _resolve_quote_type(self, file_path: Path) -> str:
+        """Check that file_path is an existing quote CSV file and return its quote type.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is unsupported (e.g., metadata files)
+        """
         if not file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
@@ -141,25 +309,803 @@ class CSVQuoteReader(CSVParserMixin):
         if not quote_type:
             raise ValueError(f"Unsupported CSV file type: {file_path.stem}. "
                            f"This may be a metadata file (use CSVMetadataReader instead).")
+        return quote_type
+
+    def _iter_csv_rows(self, file_path: Path, quote_type: str) -> Iterator[Quote]:
+        """Parse a quote CSV file row by row with _parse_csv_row, yielding each quote.
+
+        Rows that fail to parse are reported and skipped.
+        """
+        with open(file_path, 'r', encoding='utf-8') as csvfile:
+            yield from self._iter_csv_stream(csvfile, quote_type, file_path)
+
+    def _iter_csv_stream(self, csvfile: TextIO, quote_type: str, name: Union[str, Path]) -> Iterator[Quote]:
+        """_iter_csv_rows over an open text stream; name identifies it in warnings."""
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        # Blank lines are skipped without a row number, as DictReader and
+        # pyarrow skip them, so warnings name the same rows on both paths
+        records = filter(None, reader)
+        width = len(header)
+        # The field parser is the same for every row of the file
+        parse_fields = self._field_parsers[quote_type]
+        for row_num, record in enumerate(records, start=2):  # Start at 2 (header is row 1)
+            try:
+                # Zip the record onto the header in C rather than through
+                # DictReader's pure-Python __next__. As with DictReader, fields
+                # past the header's are ignored and missing ones read as None
+                row = dict(zip(header, record))
+                if len(record) < width:
+                    row.update(dict.fromkeys(header[len(record):]))
+                quote = self._parse_csv_row(quote_type, row, parse_fields)
+                if quote:
+                    yield quote
+            except Exception as e:
+                # Log but continue processing remaining rows
+                print(f"Warning: Error parsing row {row_num} in {name}: {e}")
+
+    def read_csv_directory(self, directory_path: Union[str, Path], max_workers: int = 1) -> Dict[str, List[Quote]]:
+        """Read every quote CSV file in a directory.
+
+        Files whose type is not supported (including metadata files) are skipped.
+        The files are independent, so with max_workers > 1 they are parsed in
+        separate worker processes; parsing is GIL-bound, so threads would not
+        help. Each worker's quotes are pickled back to the calling process, which
+        bounds the speed-up for files with many cheap rows.
+
+        Args:
+            directory_path: Path to directory containing CSV files
+            max_workers: Number of worker processes; 1 reads in the calling process
+
+        Returns:
+            Dictionary mapping filenames to lists of Quote objects (failed files → [])
+
+        Raises:
+            NotADirectoryError: If the directory doesn't exist
+        """
+        directory_path = Path(directory_path)
+        if not directory_path.is_dir():
+            raise NotADirectoryError(f"Directory not found: {directory_path}")
+
+        csv_files = [
+            csv_file for csv_file in directory_path.glob("*.csv")
+            if self._detect_quote_type(csv_file.stem)
+        ]
+
+        results = {}
+        if max_workers <= 1:
+            for csv_file in csv_files:
+                try:
+                    results[csv_file.name] = self.read_csv_file(csv_file)
+                except Exception as e:
+                    print(f"Warning: Failed to read quotes {csv_file.name}: {e}")
+                    results[csv_file.name] = []
+            return results
+
+        # spawn rather than fork: pyarrow keeps a thread pool in this process
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {executor.submit(self.read_csv_file, csv_file): csv_file for csv_file in csv_files}
+            for future in as_completed(futures):
+                csv_file = futures[future]
+                try:
+                    results[csv_file.name] = future.result()
+                except Exception as e:
+                    print(f"Warning: Failed to read quotes {csv_file.name}: {e}")
+                    results[csv_file.name] = []
+
+        # Keep the directory listing order regardless of completion order
+        return {csv_file.name: results[csv_file.name] for csv_file in csv_files}
+
+    def read_csv_file_columnar(self, file_path: Union[str, Path]) -> 'pa.Table':
+        """Read a single-value quote CSV file into a pyarrow Table.
+
+        The table holds the same rows read_csv_file returns, one column per field,
+        without building a Quote per row. Prices are float64 and quantities int64;
+        ticker_symbol, source and exchange_code are dictionary-encoded. Use
+        Quote.from_row for one-off access to a row as a Quote.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Table with ticker_symbol, timestamp, source, exchange_code and the
+            file's Quote field (e.g. latest_price for quote_matched)
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a CSV_TO_QUOTE_FIELD_MAP quote file
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+        quote_type = self._detect_quote_type(file_path.stem)
+        if quote_type not in self.CSV_TO_QUOTE_FIELD_MAP:
+            raise ValueError(f"Unsupported CSV file type for columnar reading: {file_path.stem}. "
+                           f"Only single-value quote files are supported.")
+
+        field_name = self.CSV_TO_QUOTE_FIELD_MAP[quote_type]
+        columns = self._read_columns(file_path)
+        # Quote converts or rejects each value of a price column read into a
+        # quantity field, and the reverse, so such files are read as quotes
+        if columns is None or 'tickersymbol' not in columns or (
+            ('price' in columns or 'quantity' in columns)
+            and ('price' in columns) != (field_name in QUOTE_DECIMAL_ATTRIBUTES)
+        ):
+            return self._quotes_to_table(self.read_csv_file(file_path), field_name, file_path)
+
+        row_count = len(columns['tickersymbol'])
+        tickers, encoded_tickers, timestamps = self._parse_tickers_and_timestamps(columns)
+        ticker_symbols, exchange_codes = self._ticker_label_arrays(columns, tickers, encoded_tickers)
+        self._report_empty_symbol_rows(self._empty_symbol_rows(tickers, encoded_tickers, timestamps), file_path)
+
+        table = pa.table({
+            'ticker_symbol': ticker_symbols,
+            'timestamp': timestamps,
+            'source': pa.repeat(self.default_source, row_count),
+            'exchange_code': exchange_codes,
+            field_name: self._value_array(columns, field_name, file_path),
+        })
+        # Same rows the row path skips: no ticker or no parseable timestamp
+        table = table.filter(pc.and_(pc.is_valid(ticker_symbols), pc.is_valid(timestamps)))
+        return self._dictionary_encode_labels(table)
+
+    def _ticker_label_arrays(
+        self,
+        columns: Dict[str, 'pa.Array'],
+        tickers: List[Optional[Tuple[str, Optional[str]]]],
+        encoded_tickers: 'pa.DictionaryArray',
+    ) -> Tuple['pa.Array', 'pa.Array']:
+        """Ticker symbol and exchange code of each row, as string arrays.
+
+        The symbol is null where the row has none, including a cell like "HSX:"
+        that Quote rejects; the exchangeid column takes precedence over a
+        ticker's exchange prefix.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        ticker_symbols = pa.array(
+            [(ticker[0] or None) if ticker else None for ticker in tickers], pa.string()
+        ).take(encoded_tickers.indices)
+        exchange_codes = pa.array(
+            [ticker[1] if ticker else None for ticker in tickers], pa.string()
+        ).take(encoded_tickers.indices)
+        if 'exchangeid' in columns:
+            exchange_codes = pc.coalesce(
+                self._parse_unique_array(columns['exchangeid'], lambda value: value.strip() or None, pa.string()),
+                exchange_codes,
+            )
+        return ticker_symbols, exchange_codes
+
+    def _value_array(self, columns: Dict[str, 'pa.Array'], field_name: str, file_path: Path) -> 'pa.Array':
+        """field_name's value of each row for read_csv_file_columnar: float64 prices, int64 quantities."""
+        import pyarrow as pa
+
+        if 'price' in columns:
+            return self._parse_unique_array(columns['price'], self._parse_float, pa.float64())
+        if 'quantity' in columns:
+            return self._int64_array(self._parse_integer_column(columns['quantity']), file_path)
+        return pa.nulls(len(columns['tickersymbol']), self._columnar_value_type(field_name))
+
+    def _quotes_to_table(self, quotes: List[Quote], field_name: str, file_path: Path) -> 'pa.Table':
+        """Build the read_csv_file_columnar table from already parsed quotes."""
+        import pyarrow as pa
+
+        value_type = self._columnar_value_type(field_name)
+        values = [getattr(quote, field_name) for quote in quotes]
+        if value_type == pa.float64():
+            values = pa.array([None if value is None else float(value) for value in values], value_type)
+        else:
+            values = self._int64_array(values, file_path)
+
+        table = pa.table({
+            'ticker_symbol': pa.array([quote.ticker_symbol for quote in quotes], pa.string()),
+            'timestamp': pa.array([quote.timestamp for quote in quotes], pa.float64()),
+            'source': pa.array([quote.source for quote in quotes], pa.string()),
+            'exchange_code': pa.array([quote.exchange_code for quote in quotes], pa.string()),
+            field_name: values,
+        })
+        return self._dictionary_encode_labels(table)
+
+    @staticmethod
+    def _int64_array(values: List[Optional[int]], file_path: Path) -> 'pa.Array':
+        """Arrow int64 array of parsed quantities.
+
+        parse_integer returns ints of any size; a value past int64's range
+        becomes null, with a warning, rather than failing the whole column.
+        """
+        import pyarrow as pa
 
-        quotes = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                    try:
-                        quote = self._parse_csv_row(quote_type, row)
-                        if quote:
-                            quotes.append(quote)
-                    except Exception as e:
-                        # Log but continue processing remaining rows
-                        print(f"Warning: Error parsing row {row_num} in {file_path}: {e}")
+            return pa.array(values, pa.int64())
+        except OverflowError:
+            pass
 
-        except Exception as e:
-            raise ValueError(f"Error reading CSV file {file_path}: {e}")
+        values = list(values)
+        for index, value in enumerate(values):
+            if value is not None and not _INT64_MIN <= value <= _INT64_MAX:
+                print(f"Warning: Quantity {value} in {file_path} does not fit int64; stored as null")
+                values[index] = None
+        return pa.array(values, pa.int64())
+
+    @staticmethod
+    def _dictionary_encode_labels(table: 'pa.Table') -> 'pa.Table':
+        """Dictionary-encode the heavily repeated string columns of a quote table."""
+        import pyarrow.compute as pc
+
+        for name in ('ticker_symbol', 'source', 'exchange_code'):
+            index = table.schema.get_field_index(name)
+            table = table.set_column(index, name, pc.dictionary_encode(table.column(name)))
+        return table
+
+    @staticmethod
+    def _columnar_value_type(field_name: str) -> 'pa.DataType':
+        """Arrow type of a Quote field in columnar output: float64 prices, int64 quantities."""
+        import pyarrow as pa
+
+        return pa.float64() if field_name in QUOTE_DECIMAL_ATTRIBUTES else pa.int64()
+
+    def _parse_float(self, value_str: str) -> Optional[float]:
+        """parse_decimal, as a float for columnar output.
+
+        Parses with float() directly instead of building a Decimal only to
+        convert it; both round the same decimal string to the same double.
+        Decimal also takes underscores anywhere and NaN payloads, so strings
+        float() does not take the same way go through parse_decimal.
+        """
+        if '_' not in value_str:
+            try:
+                return float(value_str)
+            except ValueError:
+                pass
+        value = self.parse_decimal(value_str)
+        return None if value is None or value.is_snan() else float(value)
+
+    def _read_columns(self, file_path: Path) -> Optional[Dict[str, 'pa.Array']]:
+        """Read every column of a CSV file as strings with pyarrow's C tokenizer.
+
+        The header is read with the stdlib csv module so column names match what
+        the row path sees. The file body is memory-mapped and parsed into Arrow
+        string arrays without type inference, so the scalar parsers still decide
+        what is valid. Rows whose field count differs from the header's are read
+        as the row path reads them: extra trailing fields are ignored and missing
+        ones are empty, which every value parser treats as it treats None.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Mapping of column name to string array, or None if the file has
+            duplicate column names, rows pyarrow cannot tokenize, or short rows
+            missing their ticker or exchange cell
+        """
+        import pyarrow as pa
+
+        with open(file_path, 'r', encoding='utf-8') as csvfile:
+            header = next(csv.reader(csvfile), None)
+        if not header or len(set(header)) != len(header):
+            return None
 
+        try:
+            table, ragged_rows = self._read_string_table(file_path, header, use_threads=True)
+            if ragged_rows:
+                # Only a single-threaded read numbers the rows it sets aside
+                table, ragged_rows = self._read_string_table(file_path, header, use_threads=False)
+                table = self._splice_ragged_rows(table, ragged_rows, header)
+        except pa.ArrowInvalid:
+            return None
+
+        columns = {name: table.column(name).combine_chunks() for name in header}
+        # The row path fails on a missing ticker or exchange cell and reports the row
+        if any(columns[name].null_count for name in ('tickersymbol', 'exchangeid') if name in columns):
+            return None
+        return {name: column.fill_null('') if column.null_count else column for name, column in columns.items()}
+
+    @staticmethod
+    def _read_string_table(
+        file_path: Path, header: List[str], use_threads: bool
+    ) -> Tuple['pa.Table', List[Tuple[Optional[int], str]]]:
+        """Read a CSV body as string columns named after header.
+
+        Rows whose field count differs from the header's are left out of the
+        table and returned as (row number, text); the row number is None unless
+        use_threads is False.
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        ragged_rows = []
+
+        def set_aside(row) -> str:
+            ragged_rows.append((row.number, row.text))
+            return 'skip'
+
+        with pa.memory_map(str(file_path)) as source:
+            table = pa_csv.read_csv(
+                source,
+                read_options=pa_csv.ReadOptions(
+                    column_names=header, skip_rows=1, block_size=8 << 20, use_threads=use_threads
+                ),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True, invalid_row_handler=set_aside),
+                convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in header}),
+            )
+        return table, ragged_rows
+
+    @staticmethod
+    def _splice_ragged_rows(table: 'pa.Table', ragged_rows: List[Tuple[int, str]], header: List[str]) -> 'pa.Table':
+        """Put the rows _read_string_table set aside back into the table, in file order.
+
+        Each row keeps its first len(header) fields; missing trailing fields are null.
+        """
+        import pyarrow as pa
+
+        width = len(header)
+        pieces, start = [], 0
+        for index, (row_num, text) in enumerate(sorted(ragged_rows)):
+            # Row numbers count the header as row 1 and skip blank lines
+            end = row_num - 2 - index
+            pieces.append(table.slice(start, end - start))
+            record = next(csv.reader([text]), [])[:width]
+            record += [None] * (width - len(record))
+            pieces.append(pa.table({name: pa.array([value], pa.string()) for name, value in zip(header, record)}))
+            start = end
+        pieces.append(table.slice(start))
+        return pa.concat_tables(pieces)
+
+    @staticmethod
+    def _parse_unique(values: 'pa.Array', parser) -> List[Any]:
+        """Apply a scalar parser once per distinct value of a string column.
+
+        Market data columns repeat heavily (dates, tickers, prices on the tick
+        grid), so dictionary-encoding the column first turns N parser calls into
+        one call per distinct string followed by a list gather.
+        """
+        import pyarrow.compute as pc
+
+        encoded = pc.dictionary_encode(values)
+        parsed = [parser(value) for value in encoded.dictionary.to_pylist()]
+        return list(map(parsed.__getitem__, encoded.indices.to_pylist()))
+
+    @staticmethod
+    def _parse_unique_array(values: 'pa.Array', parser, value_type: 'pa.DataType') -> 'pa.Array':
+        """_parse_unique, gathered into an Arrow array of value_type instead of a list."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        encoded = pc.dictionary_encode(values)
+        parsed = pa.array([parser(value) for value in encoded.dictionary.to_pylist()], value_type)
+        return parsed.take(encoded.indices)
+
+    def _parse_integer_column(self, values: 'pa.Array') -> List[Optional[int]]:
+        """Vectorized parse_integer over a string column.
+
+        Cells are trimmed by Arrow first, as parse_integer strips them. Plain
+        integer strings (an optional minus sign and up to 18 digits, so they fit
+        int64) are then cast by Arrow in one call. Signed or decimal strings and
+        empty cells go through parse_integer, once per distinct string.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        values = pc.utf8_trim_whitespace(values)
+        plain = pc.match_substring_regex(values, _PLAIN_INTEGER_REGEX)
+        if pc.all(plain).as_py():
+            return values.cast(pa.int64()).to_pylist()
+
+        parsed = pc.if_else(plain, values, None).cast(pa.int64()).to_pylist()
+        other = pc.invert(plain)
+        for index, value in zip(
+            pc.indices_nonzero(other).to_pylist(), self._parse_unique(values.filter(other), self.parse_integer)
+        ):
+            parsed[index] = value
+        return parsed
+
+    def _parse_timestamp_column(self, values: 'pa.Array') -> 'pa.Array':
+        """Vectorized parse_timestamp over a string column, as a float64 array.
+
+        Distinct canonical strings ("YYYY-MM-DD[ HH:MM:SS[.ffffff]]") are parsed
+        by Arrow as naive wall-clock times, then shifted by the local UTC offset
+        of their minute, which is computed once per distinct minute with the
+        same naive datetime.timestamp() call parse_timestamp makes. Strings
+        Arrow would silently normalize (e.g. "2023-02-30"), minutes that contain
+        an offset change, and every other layout go through parse_timestamp.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        encoded = pc.dictionary_encode(values)
+        wall_clock, microseconds = self._canonical_wall_clock(encoded.dictionary)
+        wall_seconds = wall_clock.cast(pa.int64())
+        # Wall-clock start of each minute, without floor division on negative values
+        offsets = self._local_utc_offsets(pc.subtract(wall_seconds, pc.second(wall_clock)))
+
+        # Same arithmetic as datetime.timestamp(): whole seconds + microseconds / 1e6
+        timestamps = pc.add(
+            pc.add(wall_seconds, offsets).cast(pa.float64()),
+            pc.divide(microseconds.cast(pa.float64()), 1e6),
+        )
+
+        unparsed = pc.indices_nonzero(pc.is_null(timestamps)).to_pylist()
+        if unparsed:
+            parsed = timestamps.to_pylist()
+            for index, timestamp_str in zip(unparsed, encoded.dictionary.take(unparsed).to_pylist()):
+                parsed[index] = self.parse_timestamp(timestamp_str)
+            timestamps = pa.array(parsed, pa.float64())
+        return timestamps.take(encoded.indices)
+
+    @classmethod
+    def _canonical_wall_clock(cls, strings: 'pa.Array') -> Tuple['pa.Array', 'pa.Array']:
+        """Parse canonical timestamp strings as naive wall-clock times.
+
+        Returns:
+            (timestamp[s] array, int64 microseconds); the time is null where a
+            string is not canonical or names a date or time that does not exist
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        canonical = pc.match_substring_regex(strings, _CANONICAL_TIMESTAMP_REGEX)
+        strings = pc.if_else(canonical, strings, None)
+        strings = pc.if_else(
+            pc.equal(pc.utf8_length(strings), 10), pc.binary_join_element_wise(strings, ' 00:00:00', ''), strings
+        )
+        whole_seconds = pc.utf8_slice_codeunits(strings, 0, 19)
+        wall_clock = pc.strptime(whole_seconds, format=_TIMESTAMP_FORMAT, unit='s', error_is_null=True)
+        wall_clock = pc.if_else(cls._fields_read_back(wall_clock, whole_seconds), wall_clock, None)
+        microseconds = pc.utf8_rpad(pc.utf8_slice_codeunits(strings, 20, 26), 6, '0').cast(pa.int64())
+        return wall_clock, microseconds
+
+    @staticmethod
+    def _fields_read_back(wall_clock: 'pa.Array', whole_seconds: 'pa.Array') -> 'pa.Array':
+        """Whether each parsed time has the fields of its "YYYY-MM-DD HH:MM:SS" string.
+
+        Arrow rolls some out-of-range fields over (Feb 30 -> Mar 2, :60 -> next
+        minute) where parse_timestamp rejects them.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        fields_match = pc.is_valid(wall_clock)
+        for extract, start, end in (
+            (pc.year, 0, 4), (pc.month, 5, 7), (pc.day, 8, 10),
+            (pc.hour, 11, 13), (pc.minute, 14, 16), (pc.second, 17, 19),
+        ):
+            fields_match = pc.and_kleene(
+                fields_match,
+                pc.equal(extract(wall_clock), pc.utf8_slice_codeunits(whole_seconds, start, end).cast(pa.int64())),
+            )
+        return fields_match
+
+    @staticmethod
+    def _local_utc_offsets(minute_starts: 'pa.Array') -> 'pa.Array':
+        """_local_utc_offset of each naive wall-clock minute, computed once per distinct minute."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        encoded_minutes = pc.dictionary_encode(minute_starts)
+        return pa.array(
+            [_local_utc_offset(minute_start) for minute_start in encoded_minutes.dictionary.to_pylist()], pa.int64()
+        ).take(encoded_minutes.indices)
+
+    @staticmethod
+    def _timestamp_strings(columns: Dict[str, 'pa.Array']) -> Optional['pa.Array']:
+        """Timestamp column with the row path's precedence: datetime, else date."""
+        import pyarrow.compute as pc
+
+        timestamp_strings = columns.get('datetime')
+        if 'date' in columns:
+            timestamp_strings = columns['date'] if timestamp_strings is None else pc.if_else(
+                pc.equal(timestamp_strings, ''), columns['date'], timestamp_strings
+            )
+        return timestamp_strings
+
+    @staticmethod
+    def _empty_symbol_rows(
+        tickers: List[Optional[Tuple[str, Optional[str]]]], encoded_tickers: 'pa.DictionaryArray', timestamps: 'pa.Array'
+    ) -> List[int]:
+        """Indices of the rows the row loop reports for a ticker cell that leaves
+        no symbol (e.g. "HSX:"); rows without a timestamp are skipped before that.
+
+        Args:
+            tickers: _split_ticker of each distinct ticker cell
+            encoded_tickers: The ticker column, dictionary-encoded
+            timestamps: Parsed timestamp of each row
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        empty_symbol = pa.array([ticker is not None and not ticker[0] for ticker in tickers], pa.bool_())
+        return pc.indices_nonzero(
+            pc.and_(empty_symbol.take(encoded_tickers.indices), pc.is_valid(timestamps))
+        ).to_pylist()
+
+    @staticmethod
+    def _report_empty_symbol_rows(rows: List[int], file_path: Path) -> None:
+        """Print the row loop's warning for each of _empty_symbol_rows."""
+        for index in rows:
+            print(f"Warning: Error parsing row {index + 2} in {file_path}: ticker_symbol cannot be empty")
+
+    @staticmethod
+    def _split_ticker(raw_ticker: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Split a raw ticker cell into (ticker, exchange prefix), e.g. "HSX:VIC".
+
+        Returns None for an empty cell, which means the row is skipped.
+        """
+        return _split_ticker_cell(raw_ticker)
+
+    def _read_columnar(self, file_path: Path, quote_type: str) -> Optional[List[Quote]]:
+        """Columnar equivalent of the row loop.
+
+        Produces the same quotes as parsing each row with _parse_csv_row, but
+        tokenizes the file in C and parses each distinct ticker, timestamp,
+        depth and value string only once. Rows are validated with one Arrow
+        mask, so only the kept rows reach the Python-level parsers, and no
+        per-row dict is built.
+
+        Args:
+            file_path: Path to the CSV file
+            quote_type: Type of quote data (a supported filename prefix)
+
+        Returns:
+            List of Quote objects, or None if the file must be read row by row
+        """
+        columns = self._read_columns(file_path)
+        if columns is None:
+            return None
+        if 'tickersymbol' not in columns:
+            return []
+
+        columns, labels, empty_symbol_rows = self._kept_rows(columns)
+
+        if quote_type in self.MULTI_COLUMN_FIELDS:
+            # The row loop converts these fields before Quote rejects an empty
+            # symbol, so the error such a row reports depends on its values
+            if empty_symbol_rows:
+                return None
+            return self._multi_column_quotes(quote_type, columns, labels)
+
+        field_groups = self._field_groups(quote_type, columns)
+        if field_groups is None:
+            return None
+        values = self._value_column(quote_type, columns, len(labels[1]))
+        if values is None:
+            return None
+
+        self._report_empty_symbol_rows(empty_symbol_rows, file_path)
+        return self._grouped_quotes(labels, field_groups, values, self._default_field(quote_type))
+
+    def _parse_tickers_and_timestamps(
+        self, columns: Dict[str, 'pa.Array']
+    ) -> Tuple[List[Optional[Tuple[str, Optional[str]]]], 'pa.DictionaryArray', 'pa.Array']:
+        """Parse the ticker and timestamp columns of a file read by _read_columns.
+
+        Returns:
+            (_split_ticker of each distinct ticker cell, the dictionary-encoded
+            ticker column, float64 timestamp of each row)
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        encoded_tickers = pc.dictionary_encode(columns['tickersymbol'])
+        tickers = [self._split_ticker(value) for value in encoded_tickers.dictionary.to_pylist()]
+
+        timestamp_strings = self._timestamp_strings(columns)
+        timestamps = (
+            self._parse_timestamp_column(timestamp_strings)
+            if timestamp_strings is not None else pa.nulls(len(encoded_tickers), pa.float64())
+        )
+        return tickers, encoded_tickers, timestamps
+
+    def _kept_rows(self, columns: Dict[str, 'pa.Array']) -> Tuple[Dict[str, 'pa.Array'], _QuoteLabels, List[int]]:
+        """Select the rows the row loop builds a quote for and parse their labels.
+
+        The row loop skips rows without a ticker or a parseable timestamp, and
+        reports a cell like "HSX:" that leaves no symbol, which Quote rejects.
+
+        Returns:
+            (the kept rows' columns, their (ticker_symbols, timestamps,
+            exchange_codes), indices of the rows reported for an empty symbol)
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        tickers, encoded_tickers, timestamps = self._parse_tickers_and_timestamps(columns)
+        empty_symbol_rows = self._empty_symbol_rows(tickers, encoded_tickers, timestamps)
+        has_symbol = pa.array([bool(ticker and ticker[0]) for ticker in tickers], pa.bool_())
+        keep = pc.and_(has_symbol.take(encoded_tickers.indices), pc.is_valid(timestamps))
+        columns = {name: column.filter(keep) for name, column in columns.items()}
+
+        ticker_codes = encoded_tickers.indices.filter(keep).to_pylist()
+        ticker_symbols = list(map([ticker and ticker[0] for ticker in tickers].__getitem__, ticker_codes))
+        exchange_codes = list(map([ticker and ticker[1] for ticker in tickers].__getitem__, ticker_codes))
+        if 'exchangeid' in columns:
+            exchange_codes = [
+                exchange_code or exchange_from_ticker
+                for exchange_code, exchange_from_ticker in zip(
+                    self._parse_unique(columns['exchangeid'], lambda value: value.strip() or None), exchange_codes
+                )
+            ]
+        return columns, (ticker_symbols, timestamps.filter(keep).to_pylist(), exchange_codes), empty_symbol_rows
+
+    def _default_field(self, quote_type: str) -> str:
+        """Quote field of a single-value file, or of level 1 of a depth file."""
+        if quote_type in self.DEPTH_FIELDS:
+            return f"{self.DEPTH_FIELDS[quote_type]}_1"
+        return self.CSV_TO_QUOTE_FIELD_MAP[quote_type]
+
+    def _field_groups(
+        self, quote_type: str, columns: Dict[str, 'pa.Array']
+    ) -> Optional[Dict[Optional[str], Optional[List[int]]]]:
+        """Quote field of each row's value, as _parse_simple_field and _parse_depth_field pick it.
+
+        Args:
+            quote_type: Type of quote data (not a multi-column file)
+            columns: The file's kept rows, as string columns
+
+        Returns:
+            Mapping of field name to the indices of its rows, or to None when
+            every row belongs to it; the None field groups depth levels past 10,
+            which have no Quote field. None if the file must be read row by row.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if quote_type not in self.DEPTH_FIELDS or 'depth' not in columns:
+            return {self._default_field(quote_type): None}
+
+        encoded_depths = pc.dictionary_encode(columns['depth'])
+        code_groups = {}
+        for code, depth_str in enumerate(encoded_depths.dictionary.to_pylist()):
+            code_groups.setdefault(self._depth_field_name(self.DEPTH_FIELDS[quote_type], depth_str), []).append(code)
+        # A negative depth names no Quote field, which the row loop reports per row
+        if not set(code_groups) - {None} <= _QUOTE_FIELD_NAMES:
+            return None
+        if len(code_groups) == 1:
+            return dict.fromkeys(code_groups)
+
+        depth_codes = encoded_depths.indices
+        return {
+            field_name: pc.indices_nonzero(pc.is_in(depth_codes, pa.array(codes, depth_codes.type))).to_pylist()
+            for field_name, codes in code_groups.items()
+        }
+
+    def _value_column(self, quote_type: str, columns: Dict[str, 'pa.Array'], row_count: int) -> Optional[List[Any]]:
+        """Parse each row's price or quantity, as _parse_simple_field does.
+
+        Returns:
+            The parsed values, or None if they do not have the type of the
+            file's field: Quote would convert or reject each one, which the row
+            loop leaves to it
+        """
+        import pyarrow.compute as pc
+
+        field_is_decimal = self._default_field(quote_type) in QUOTE_DECIMAL_ATTRIBUTES
+        if 'price' in columns:
+            if not field_is_decimal:
+                return None
+            # Trimmed in one Arrow pass, so padded and unpadded copies of a
+            # price share one distinct string and one parse_decimal call
+            return self._parse_unique(pc.utf8_trim_whitespace(columns['price']), self.parse_decimal)
+        if 'quantity' in columns:
+            if field_is_decimal:
+                return None
+            return self._parse_integer_column(columns['quantity'])
+        return [None] * row_count
+
+    def _grouped_quotes(
+        self,
+        labels: _QuoteLabels,
+        field_groups: Dict[Optional[str], Optional[List[int]]],
+        values: List[Any],
+        default_field: str,
+    ) -> List[Quote]:
+        """Build each field group's quotes with one bulk_from_columns call, in file order.
+
+        Args:
+            labels: (ticker_symbols, timestamps, exchange_codes) of the rows
+            field_groups: Rows of each Quote field, from _field_groups
+            values: Value of each row
+            default_field: Field the quotes of the None group are built with,
+                without a value
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        quotes, positions = [], []
+        for field_name, rows in field_groups.items():
+            if rows is None:
+                group_labels, group_values = labels, values
+            else:
+                group_labels = [list(map(column.__getitem__, rows)) for column in labels]
+                group_values = list(map(values.__getitem__, rows))
+                positions += rows
+            if field_name is None:
+                # Levels past 10 have no Quote field, so their quotes hold no value
+                field_name, group_values = default_field, [None] * len(group_values)
+            ticker_symbols, timestamps, exchange_codes = group_labels
+            quotes += Quote.bulk_from_columns(
+                ticker_symbols, timestamps, self.default_source, exchange_codes, field_name, group_values
+            )
+
+        if not positions:
+            return quotes
+        return list(map(quotes.__getitem__, pc.sort_indices(pa.array(positions, pa.int64())).to_pylist()))
+
+    def _multi_column_quotes(
+        self, quote_type: str, columns: Dict[str, 'pa.Array'], labels: _QuoteLabels
+    ) -> Optional[List[Quote]]:
+        """Build the quotes of a multi-column file from its kept rows.
+
+        Returns:
+            List of Quote objects, or None if the file must be read row by row
+        """
+        field_values = self._multi_column_values(quote_type, columns)
+        if field_values is None:
+            return None
+
+        ticker_symbols, timestamps, exchange_codes = labels
+        # The first field is filled by bulk_from_columns, the others on the built quotes
+        fields = iter(field_values.items())
+        field_name, values = next(fields, ('latest_price', [None] * len(timestamps)))
+        quotes = Quote.bulk_from_columns(
+            ticker_symbols, timestamps, self.default_source, exchange_codes, field_name, values
+        )
+        for field_name, values in fields:
+            for quote, value in zip(quotes, values):
+                if value is not None:
+                    setattr(quote, field_name, value)
         return quotes
 
+    def _multi_column_values(self, quote_type: str, columns: Dict[str, 'pa.Array']) -> Optional[Dict[str, List[Any]]]:
+        """Columnar equivalent of _parse_multi_column_field.
+
+        Args:
+            quote_type: Type of quote data (a MULTI_COLUMN_FIELDS key)
+            columns: The file's kept rows, as string columns
+
+        Returns:
+            Mapping of Quote field to its value per row, or None if the file
+            must be read row by row
+        """
+        import pyarrow.compute as pc
+
+        field_values = {}
+        if quote_type in ('quote_foreignbuyvalue', 'quote_foreignsellvalue'):
+            if 'matched_vol' in columns:
+                qty_field = 'foreign_buy_qty' if 'buy' in quote_type else 'foreign_sell_qty'
+                field_values[qty_field] = self._parse_integer_column(columns['matched_vol'])
+            if 'latest_price' in columns:
+                field_values['latest_price'] = self._parse_unique(
+                    pc.utf8_trim_whitespace(columns['latest_price']), self.parse_decimal
+                )
+
+        elif quote_type.startswith('quote_vn30foreign'):
+            qty_field = 'foreign_buy_qty' if 'buy' in quote_type else 'foreign_sell_qty' if 'sell' in quote_type else None
+            if qty_field and 'value' in columns:
+                values = self._parse_unique(pc.utf8_trim_whitespace(columns['value']), self.parse_decimal)
+                # int() rejects NaN and infinity, which the row loop reports per row
+                if not all(value is None or value.is_finite() for value in values):
+                    return None
+                field_values[qty_field] = [None if value is None else int(value) for value in values]
+            if 'intraday_acc_value' in columns:
+                field_values['latest_price'] = self._parse_unique(
+                    pc.utf8_trim_whitespace(columns['intraday_acc_value']), self.parse_decimal
+                )
+
+        return field_values
+
+    def _depth_field_name(self, base_field: str, depth_str: str) -> Optional[str]:
+        """Quote field of a depth level, as _parse_depth_field picks it; None past level 10."""
+        depth = self.parse_integer(depth_str) or 1
+        return f"{base_field}_{depth}" if depth <= 10 else None
+
     def _detect_quote_type(self, filename: str) -> Optional[str]:
         """Detect quote type from filename.
 
@@ -169,74 +1115,51 @@ class CSVQuoteReader(CSVParserMixin):
         Returns:
             Quote type identifier or None if unsupported/metadata file
         """
-        # Reject metadata files (should use CSVMetadataReader)
-        if filename in ['quote_ticker', 'quote_vn30', 'quote_futurecontractcode']:
-            return None
-
-        # Handle exact matches for quote files
-        if filename in self.CSV_TO_QUOTE_FIELD_MAP:
-            return filename
-        elif filename in self.DEPTH_FIELDS:
-            return filename
-        elif filename in self.MULTI_COLUMN_FIELDS:
-            return filename
+        # _field_parsers is keyed by every supported quote type, so this is one
+        # dict probe; metadata files (use CSVMetadataReader) are not among them
+        return filename if filename in self._field_parsers else None
 
-        return None
-
-    def _parse_csv_row(self, quote_type: str, row: Dict[str, str]) -> Optional[Quote]:
+    def _parse_csv_row(
+        self, quote_type: str, row: Dict[str, str], parse_fields: Optional[Callable[..., None]] = None
+    ) -> Optional[Quote]:
         """Parse a single CSV row into a Quote object.
 
         Args:
             quote_type: Type of quote data (filename prefix)
             row: CSV row as dictionary
+            parse_fields: quote_type's field parser, when the caller already
+                looked it up for the whole file
 
         Returns:
             Quote object or None if row should be skipped
         """
-        # Skip empty rows
-        if not any(row.values()):
-            return None
-
-        # Extract common fields
-        ticker_symbol = row.get('tickersymbol', '').strip()
-        if not ticker_symbol:
+        # Extract common fields (an empty row has no ticker, so it is skipped here).
+        # A ticker may carry an exchange prefix (e.g., "HSX:VIC"); the split is
+        # memoized, so rows of the same ticker share one symbol string
+        ticker = _split_ticker_cell(row.get('tickersymbol', ''))
+        if ticker is None:
             return None
+        clean_ticker, exchange_from_ticker = ticker
 
         # Parse timestamp
         timestamp = self.parse_timestamp(row.get('datetime', '') or row.get('date', ''))
         if timestamp is None:
             return None
 
-        # Extract exchange_code if present in CSV (parse as-is, no inference)
-        exchange_code = row.get('exchangeid', '').strip() or None
-
-        # Handle ticker_symbol that may contain exchange prefix (e.g., "HSX:VIC")
-        if ':' in ticker_symbol:
-            # Extract exchange and ticker from "EXCHANGE:TICKER" format
-            parts = ticker_symbol.split(':', 1)
-            exchange_from_ticker = parts[0].strip()
-            clean_ticker = parts[1].strip()
-            # Use exchange from ticker if exchange_code not already set
-            if not exchange_code:
-                exchange_code = exchange_from_ticker
-        else:
-            # Ticker without exchange prefix - store as-is
-            clean_ticker = ticker_symbol
-            # exchange_code remains as-is from CSV (could be None)
+        # Extract exchange_code if present in CSV (parse as-is, no inference);
+        # otherwise use the exchange from the ticker prefix, if any
+        exchange_code = row.get('exchangeid', '').strip() or exchange_from_ticker
 
         # Initialize quote with basic fields
         quote_kwargs = {}
 
         # Handle different quote types
-        if quote_type in self.CSV_TO_QUOTE_FIELD_MAP:
-            self._parse_simple_field(quote_type, row, quote_kwargs)
-        elif quote_type in self.DEPTH_FIELDS:
-            self._parse_depth_field(quote_type, row, quote_kwargs)
-        elif quote_type in self.MULTI_COLUMN_FIELDS:
-            self._parse_multi_column_field(quote_type, row, quote_kwargs)
-        else:
-            # Unknown type - skip
-            return None
+        if parse_fields is None:
+            parse_fields = self._field_parsers.get(quote_type)
+            if parse_fields is None:
+                # Unknown type - skip
+                return None
+        parse_fields(quote_type, row, quote_kwargs)
 
         return Quote(
             ticker_symbol=clean_ticker,
@@ -300,9 +1223,7 @@ class CSVQuoteReader(CSVParserMixin):
             row: CSV row data
             quote_kwargs: Dictionary to update with parsed values
         """
-        columns = self.MULTI_COLUMN_FIELDS[quote_type]
-
-        if quote_type in ['quote_foreignbuyvalue', 'quote_foreignsellvalue']:
+        if quote_type in ('quote_foreignbuyvalue', 'quote_foreignsellvalue'):
             # Handle foreign value data
             if 'matched_vol' in row:
                 vol = self.parse_integer(row['matched_vol'])
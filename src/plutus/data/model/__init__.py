@@ -7,7 +7,7 @@ This module exports core data models:
 """
 
 from plutus.data.model.quote import Quote
-from plutus.data.model.quote_named_tuple import QuoteNamedTuple, create_quote_nt
+from plutus.data.model.quote_named_tuple import QuoteNamedTuple, create_quote_nt, create_quotes_batch
 from plutus.data.model.enums import QuoteType, QUOTE_DECIMAL_ATTRIBUTES, STRING_TO_QUOTETYPE_MAP
 from plutus.data.model.metadata import InstrumentMetadata, IndexConstituent, FutureContractCode
 
@@ -16,6 +16,7 @@ __all__ = [
     'Quote',
     'QuoteNamedTuple',
     'create_quote_nt',
+    'create_quotes_batch',
 
     # Enums and mappings
     'QuoteType',
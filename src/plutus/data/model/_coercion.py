@@ -0,0 +1,54 @@
+"""Field converters shared by Quote and QuoteNamedTuple.
+
+Both models store the QuoteType fields and convert incoming market data values
+the same way: prices and values to Decimal, quantities to int and
+maturity_date to str. Fields without a converter are stored as given.
+"""
+
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from plutus.data.model.enums import QuoteType, QUOTE_DECIMAL_ATTRIBUTES
+
+
+def coerce_decimal(field_name: str, value: Any) -> Decimal:
+    """Convert a price/value field to Decimal."""
+    if isinstance(value, Decimal):
+        return value
+    elif isinstance(value, (str, int, float)):
+        try:
+            return Decimal(str(value))
+        except (ValueError, TypeError, InvalidOperation) as e:
+            raise ValueError(f"Cannot convert {value} to Decimal for field {field_name}: {e}")
+    else:
+        raise TypeError(f"Field {field_name} expects Decimal, str, int, or float, got {type(value)}")
+
+
+def coerce_int(field_name: str, value: Any) -> int:
+    """Convert a quantity field to int."""
+    if isinstance(value, int):
+        return value
+    elif isinstance(value, (str, float)):
+        try:
+            return int(value)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Cannot convert {value} to int for field {field_name}: {e}")
+    else:
+        raise TypeError(f"Field {field_name} expects int, str, or float, got {type(value)}")
+
+
+def coerce_str(field_name: str, value: Any) -> str:
+    """Convert a string field (maturity_date) to str."""
+    return str(value)
+
+
+INT_FIELDS = ('latest_qty', 'total_matched_qty', 'foreign_buy_qty', 'foreign_sell_qty', 'foreign_room', 'open_interest')
+
+# Field name -> converter, resolved once here instead of by a chain of membership
+# and substring tests per value; Decimal fields take precedence
+_FIELD_NAMES = tuple(quote_type.value for quote_type in QuoteType)
+FIELD_COERCERS = {
+    **{name: coerce_str for name in _FIELD_NAMES if name == 'maturity_date'},
+    **{name: coerce_int for name in _FIELD_NAMES if 'qty' in name or name in INT_FIELDS},
+    **{name: coerce_decimal for name in _FIELD_NAMES if name in QUOTE_DECIMAL_ATTRIBUTES},
+}
@@ -33,7 +33,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class InstrumentMetadata:
     """Instrument reference data from quote_ticker.csv.
 
@@ -86,7 +86,7 @@ class InstrumentMetadata:
             raise TypeError(f"last_updated must be a date, got {type(self.last_updated)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexConstituent:
     """Index membership data from quote_vn30.csv.
 
@@ -124,7 +124,7 @@ class IndexConstituent:
             raise TypeError(f"effective_date must be a date, got {type(self.effective_date)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class FutureContractCode:
     """Futures contract code mapping from quote_futurecontractcode.csv.
 
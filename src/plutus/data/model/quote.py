@@ -31,10 +31,40 @@ Usage:
     Decimal('150.50')
 """
 
-from decimal import Decimal, InvalidOperation
-from typing import List, Dict, Any, Optional
+from decimal import Decimal
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Sequence
 
-from plutus.data.model.enums import QuoteType, QUOTE_DECIMAL_ATTRIBUTES
+from plutus.data.model._coercion import FIELD_COERCERS
+from plutus.data.model.enums import QuoteType
+
+
+_CORE_FIELDS = ('ticker_symbol', 'timestamp', 'source', 'exchange_code')
+
+# Market data slot names are generated from QuoteType so the enum stays the single
+# source of truth; the tuple and set are also reused by the per-instance loops
+_MARKET_DATA_SLOTS = tuple(quote_type.value for quote_type in QuoteType)
+_MARKET_DATA_SLOT_SET = frozenset(_MARKET_DATA_SLOTS)
+
+
+def _make_slot_clearer(slot_names):
+    """Build a function that sets each named slot to None in straight-line code.
+
+    One attribute store per slot avoids the per-slot setattr() call of a loop,
+    which dominated Quote construction for lean quotes.
+    """
+    source = 'def _clear_slots(self):\n' + ''.join(f'    self.{name} = None\n' for name in slot_names)
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_clear_slots']
+
+
+_clear_market_data_slots = _make_slot_clearer(_MARKET_DATA_SLOTS)
+
+
+# Reads every market data slot in one C-level call, in _MARKET_DATA_SLOTS order;
+# comparing the resulting tuples leaves the per-slot loop to C as well
+_get_market_data_values = attrgetter(*_MARKET_DATA_SLOTS)
 
 
 class Quote:
@@ -68,27 +98,8 @@ class Quote:
         >>> quote.available_quote_types()
         ['ref_price']
     """
-    __slots__ = [
-        # Core fields
-        'ticker_symbol', 'timestamp', 'source', 'exchange_code',
-        # All QuoteType fields
-        'ref_price', 'ceiling_price', 'floor_price', 'open_price', 'close_price',
-        'bid_price_10', 'bid_qty_10', 'bid_price_9', 'bid_qty_9',
-        'bid_price_8', 'bid_qty_8', 'bid_price_7', 'bid_qty_7',
-        'bid_price_6', 'bid_qty_6', 'bid_price_5', 'bid_qty_5',
-        'bid_price_4', 'bid_qty_4', 'bid_price_3', 'bid_qty_3',
-        'bid_price_2', 'bid_qty_2', 'bid_price_1', 'bid_qty_1',
-        'latest_price', 'latest_qty', 'ref_diff_abs', 'ref_diff_pct',
-        'ask_price_1', 'ask_qty_1', 'ask_price_2', 'ask_qty_2',
-        'ask_price_3', 'ask_qty_3', 'ask_price_4', 'ask_qty_4',
-        'ask_price_5', 'ask_qty_5', 'ask_price_6', 'ask_qty_6',
-        'ask_price_7', 'ask_qty_7', 'ask_price_8', 'ask_qty_8',
-        'ask_price_9', 'ask_qty_9', 'ask_price_10', 'ask_qty_10',
-        'total_matched_qty', 'highest_price', 'lowest_price', 'avg_price',
-        'foreign_buy_qty', 'foreign_sell_qty', 'foreign_room',
-        'maturity_date', 'latest_est_matched_price',
-        'settlement_price', 'open_interest'
-    ]
+    # Core fields followed by one slot per QuoteType, in enum order
+    __slots__ = [*_CORE_FIELDS, *_MARKET_DATA_SLOTS]
 
     def __init__(self, ticker_symbol: str, timestamp: float, source: str, exchange_code: Optional[str] = None, **kwargs):
         """Initialize Quote with required fields and optional market data.
@@ -126,16 +137,15 @@ class Quote:
         self.source = source
         self.exchange_code = exchange_code
 
-        # Initialize all slots to None
-        for slot in self.__slots__:
-            if slot not in ('ticker_symbol', 'timestamp', 'source', 'exchange_code'):
-                setattr(self, slot, None)
+        # Initialize all market data slots to None
+        _clear_market_data_slots(self)
 
-        # Process optional market data
-        for key, value in kwargs.items():
-            if value is not None and hasattr(self, key):
-                validated_value = self._validate_and_convert_value(key, value)
-                setattr(self, key, validated_value)
+        # Process optional market data (unknown keys are ignored)
+        validate = self._validate_and_convert_value
+        for key in _MARKET_DATA_SLOT_SET & kwargs.keys():
+            value = kwargs[key]
+            if value is not None:
+                setattr(self, key, validate(key, value))
 
     def _validate_and_convert_value(self, attr_name: str, value: Any) -> Any:
         """Validate and convert value based on attribute type expectations.
@@ -151,36 +161,11 @@ class Quote:
             TypeError: If value cannot be converted to expected type
             ValueError: If value is invalid
         """
-        # Check if this should be a Decimal field
-        if attr_name in QUOTE_DECIMAL_ATTRIBUTES:
-            if isinstance(value, Decimal):
-                return value
-            elif isinstance(value, (str, int, float)):
-                try:
-                    return Decimal(str(value))
-                except (ValueError, TypeError, InvalidOperation) as e:
-                    raise ValueError(f"Cannot convert {value} to Decimal for field {attr_name}: {e}")
-            else:
-                raise TypeError(f"Field {attr_name} expects Decimal, str, int, or float, got {type(value)}")
-
-        # Check if this should be an int field (quantities)
-        elif 'qty' in attr_name or attr_name in ['latest_qty', 'total_matched_qty', 'foreign_buy_qty', 'foreign_sell_qty', 'foreign_room', 'open_interest']:
-            if isinstance(value, int):
-                return value
-            elif isinstance(value, (str, float)):
-                try:
-                    return int(value)
-                except (ValueError, TypeError) as e:
-                    raise ValueError(f"Cannot convert {value} to int for field {attr_name}: {e}")
-            else:
-                raise TypeError(f"Field {attr_name} expects int, str, or float, got {type(value)}")
-
-        # String fields
-        elif attr_name == 'maturity_date':
-            return str(value)
-
-        # Default: return as-is for unknown fields
-        return value
+        coerce = FIELD_COERCERS.get(attr_name)
+        if coerce is None:
+            # Default: return as-is for unknown fields
+            return value
+        return coerce(attr_name, value)
 
     def __getitem__(self, item: QuoteType) -> Any:
         """Allows dictionary-style access using QuoteType enums.
@@ -194,7 +179,9 @@ class Quote:
         if not isinstance(item, QuoteType):
             raise TypeError(f"Index must be a QuoteType enum member, not {type(item).__name__}")
 
-        return getattr(self, item.value, None)
+        # _value_ is the member's plain instance attribute; .value goes through
+        # an enum property, which costs more than the getattr itself
+        return getattr(self, item._value_, None)
 
     def __setitem__(self, item: QuoteType, value: Any) -> None:
         """Set values using QuoteType enum keys.
@@ -206,12 +193,13 @@ class Quote:
         if not isinstance(item, QuoteType):
             raise TypeError(f"Index must be a QuoteType enum member, not {type(item).__name__}")
 
-        if hasattr(self, item.value):
+        attr_name = item._value_
+        if hasattr(self, attr_name):
             if value is None:
-                setattr(self, item.value, None)
+                setattr(self, attr_name, None)
             else:
-                validated_value = self._validate_and_convert_value(item.value, value)
-                setattr(self, item.value, validated_value)
+                validated_value = self._validate_and_convert_value(attr_name, value)
+                setattr(self, attr_name, validated_value)
 
     def available_quote_types(self) -> List[str]:
         """Returns a list of the quote types available in this data tick.
@@ -219,12 +207,7 @@ class Quote:
         Returns:
             List of attribute names that have non-None values
         """
-        available = []
-        for slot in self.__slots__:
-            if slot not in ('ticker_symbol', 'timestamp', 'source', 'exchange_code'):
-                if getattr(self, slot, None) is not None:
-                    available.append(slot)
-        return available
+        return [slot for slot in _MARKET_DATA_SLOTS if getattr(self, slot, None) is not None]
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts data of the object into dictionary.
@@ -246,14 +229,10 @@ class Quote:
             data['exchange_code'] = self.exchange_code
 
         # Add non-None market data fields
-        for slot in self.__slots__:
-            if slot not in ('ticker_symbol', 'timestamp', 'source', 'exchange_code'):
-                value = getattr(self, slot, None)
-                if value is not None:
-                    if isinstance(value, Decimal):
-                        data[slot] = str(value)
-                    else:
-                        data[slot] = value
+        for slot in _MARKET_DATA_SLOTS:
+            value = getattr(self, slot, None)
+            if value is not None:
+                data[slot] = str(value) if isinstance(value, Decimal) else value
 
         return data
 
@@ -269,6 +248,66 @@ class Quote:
         """
         return cls(**info_dict)
 
+    @classmethod
+    def bulk_from_columns(
+        cls,
+        ticker_symbols: Sequence[str],
+        timestamps: Sequence[float],
+        source: str,
+        exchange_codes: Sequence[Optional[str]],
+        field_name: str,
+        values: Sequence[Any],
+    ) -> List['Quote']:
+        """Makes one object per row from parallel columns of a single market data field.
+
+        Skips the per-value validation of __init__, so the caller must pass data
+        __init__ would store unchanged: stripped non-empty ticker symbols, float
+        timestamps, stripped exchange codes or None, and values that are None or
+        already of field_name's type (Decimal for prices, int for quantities).
+
+        Args:
+            ticker_symbols: Ticker symbol per row
+            timestamps: Unix timestamp per row
+            source: Data source identifier shared by all rows
+            exchange_codes: Exchange code per row
+            field_name: Market data field the values belong to
+            values: Field value per row
+
+        Returns:
+            List of new Quote instances
+        """
+        if field_name not in _MARKET_DATA_SLOT_SET:
+            raise ValueError(f"Unknown market data field: {field_name}")
+
+        new_quote = cls.__new__
+        set_value = getattr(cls, field_name).__set__
+        quotes = []
+        for ticker_symbol, timestamp, exchange_code, value in zip(ticker_symbols, timestamps, exchange_codes, values):
+            quote = new_quote(cls)
+            quote.ticker_symbol = ticker_symbol
+            quote.timestamp = timestamp
+            quote.source = source
+            quote.exchange_code = exchange_code
+            _clear_market_data_slots(quote)
+            if value is not None:
+                set_value(quote, value)
+            quotes.append(quote)
+        return quotes
+
+    @classmethod
+    def from_row(cls, table: Any, index: int) -> 'Quote':
+        """Makes an object from one row of a columnar quote table.
+
+        Args:
+            table: pyarrow Table, e.g. from CSVQuoteReader.read_csv_file_columnar
+            index: Row position in the table
+
+        Returns:
+            New Quote instance
+        """
+        row = table.slice(index, 1).to_pylist()[0]
+        return cls(**{name: value for name, value in row.items() if value is not None})
+
     def __eq__(self, other: object) -> bool:
         """Compare two QuoteSlots objects for equality.
 
@@ -281,15 +320,18 @@ class Quote:
         if not isinstance(other, Quote):
             return False
 
-        # Compare all slots
-        for slot in self.__slots__:
-            if getattr(self, slot, None) != getattr(other, slot, None):
-                return False
-
-        return True
+        # Core fields first, then all market data slots as one tuple comparison
+        return (
+            self.ticker_symbol == other.ticker_symbol
+            and self.timestamp == other.timestamp
+            and self.source == other.source
+            and self.exchange_code == other.exchange_code
+            and _get_market_data_values(self) == _get_market_data_values(other)
+        )
 
     def __repr__(self) -> str:
         """String representation of Quote object."""
         non_none_fields = len(self.available_quote_types())
         exchange_str = f", exchange_code='{self.exchange_code}'" if self.exchange_code else ""
-        return f"Quote(ticker_symbol='{self.ticker_symbol}'{exchange_str}, timestamp={self.timestamp}, source='{self.source}', market_data_fields={non_none_fields})"
\ No newline at end of file
+        return f"Quote(ticker_symbol='{self.ticker_symbol}'{exchange_str}, timestamp={self.timestamp}, source='{self.source}', market_data_fields={non_none_fields})"
+
@@ -35,10 +35,17 @@ Usage:
     Decimal('150.50')
 """
 
-from typing import NamedTuple, Dict, Any, List, Optional
-from decimal import Decimal, InvalidOperation
+import sys
+from functools import partial
+from itertools import islice, repeat
+from typing import TYPE_CHECKING, NamedTuple, Dict, Any, Callable, List, Optional, Tuple
+from decimal import Decimal
 
-from plutus.data.model.enums import QuoteType, QUOTE_DECIMAL_ATTRIBUTES
+from plutus.data.model._coercion import FIELD_COERCERS, coerce_decimal, coerce_int, coerce_str
+from plutus.data.model.enums import QuoteType
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def _validate_and_convert_value(field_name: str, value: Any) -> Any:
@@ -65,36 +72,10 @@ def _validate_and_convert_value(field_name: str, value: Any) -> Any:
         >>> _validate_and_convert_value("bid_qty_1", "1000")
         1000
     """
-    # Check if this should be a Decimal field
-    if field_name in QUOTE_DECIMAL_ATTRIBUTES:
-        if isinstance(value, Decimal):
-            return value
-        elif isinstance(value, (str, int, float)):
-            try:
-                return Decimal(str(value))
-            except (ValueError, TypeError, InvalidOperation) as e:
-                raise ValueError(f"Cannot convert {value} to Decimal for field {field_name}: {e}")
-        else:
-            raise TypeError(f"Field {field_name} expects Decimal, str, int, or float, got {type(value)}")
-
-    # Check if this should be an int field (quantities)
-    elif 'qty' in field_name or field_name in ['total_matched_qty', 'foreign_buy_qty', 'foreign_sell_qty', 'foreign_room', 'open_interest']:
-        if isinstance(value, int):
-            return value
-        elif isinstance(value, (str, float)):
-            try:
-                return int(value)
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Cannot convert {value} to int for field {field_name}: {e}")
-        else:
-            raise TypeError(f"Field {field_name} expects int, str, or float, got {type(value)}")
-
-    # String fields
-    elif field_name == 'maturity_date':
-        return str(value)
-
-    # Default: return as-is
-    return value
+    coerce = FIELD_COERCERS.get(field_name)
+    if coerce is None:
+        return value
+    return coerce(field_name, value)
 
 
 class _QuoteBase(NamedTuple):
@@ -216,12 +197,14 @@ class QuoteNamedTuple(_QuoteBase):
         if not isinstance(item, QuoteType):
             raise TypeError(f"Index must be a QuoteType enum member, not {type(item).__name__}")
 
-        return getattr(self, item.value, None)
+        # _value_ is the member's plain instance attribute; .value goes through
+        # an enum property, which costs more than the getattr itself
+        return getattr(self, item._value_, None)
 
     def available_quote_types(self) -> List[str]:
         """Return list of quote types that have non-None values."""
         available = []
-        for field_name in self._fields[4:]:  # Skip the 4 required fields (ticker_symbol, timestamp, source, exchange_code)
+        for field_name in _MARKET_DATA_FIELDS:  # Skip the 4 required fields (ticker_symbol, timestamp, source, exchange_code)
             if getattr(self, field_name) is not None:
                 available.append(field_name)
         return available
@@ -240,8 +223,9 @@ class QuoteNamedTuple(_QuoteBase):
             result['exchange_code'] = self.exchange_code
 
         # Add non-None market data fields
-        for field_name in self._fields[4:]:  # Skip the 4 required fields
-            value = getattr(self, field_name)
+        # Pair names with the tuple's own values after the 4 required fields,
+        # instead of one getattr per field (self[4:] is taken by __getitem__)
+        for field_name, value in zip(_MARKET_DATA_FIELDS, islice(self, 4, None)):
             if value is not None:
                 if isinstance(value, Decimal):
                     result[field_name] = str(value)  # Convert Decimal to string for serialization
@@ -263,6 +247,59 @@ class QuoteNamedTuple(_QuoteBase):
         return f"QuoteNT(ticker_symbol='{self.ticker_symbol}'{exchange_str}, timestamp={self.timestamp}, source='{self.source}', market_data_fields={non_none_fields})"
 
 
+# Market data field names (everything after the 4 core fields), sliced once here
+# rather than per call; the set lets the factory filter keyword arguments with
+# a single intersection
+_MARKET_DATA_FIELDS = QuoteNamedTuple._fields[4:]
+_MARKET_DATA_FIELD_SET = frozenset(_MARKET_DATA_FIELDS)
+
+# Positions used by create_quote_nt to build the tuple without keyword resolution
+_FIELD_INDEX = {name: index for index, name in enumerate(QuoteNamedTuple._fields)}
+_EMPTY_MARKET_DATA = (None,) * len(_MARKET_DATA_FIELDS)
+
+# Target type per converted field: values that already have exactly this type
+# (a feed handing over Decimal/int) are stored without calling the converter
+_FIELD_TYPES = {
+    name: {coerce_decimal: Decimal, coerce_int: int, coerce_str: str}[coerce]
+    for name, coerce in FIELD_COERCERS.items()
+}
+
+
+def _make_market_data_reader(field_names):
+    """Build a function that appends each market data field's validated value to a list.
+
+    The body is generated once, like namedtuple's own methods, as one straight-line
+    get/convert/append per field in tuple order; a converter is only called when a
+    value is not already of its field's exact type, and unknown keys are ignored.
+    """
+    lines = ['def _read_market_data(values, market_data):', '    get = market_data.get']
+    for name in field_names:
+        lines.append(f'    value = get({name!r})')
+        coerce = FIELD_COERCERS.get(name)
+        if coerce is None:
+            lines.append('    values.append(value)')
+        else:
+            lines.append(
+                f'    values.append(value if value is None or type(value) is {_FIELD_TYPES[name].__name__}'
+                f' else {coerce.__name__}({name!r}, value))'
+            )
+    namespace = {
+        'Decimal': Decimal,
+        'coerce_decimal': coerce_decimal,
+        'coerce_int': coerce_int,
+        'coerce_str': coerce_str,
+    }
+    exec('\n'.join(lines), namespace)
+    return namespace['_read_market_data']
+
+
+_read_market_data = _make_market_data_reader(_MARKET_DATA_FIELDS)
+
+# Up to this many keyword arguments, create_quote_nt loops over the given fields
+# instead (measured crossover: about six fields)
+_SPARSE_FIELD_LIMIT = 6
+
+
 # Factory function for convenient creation
 def create_quote_nt(ticker_symbol: str, timestamp: float, source: str, exchange_code: Optional[str] = None, **market_data) -> QuoteNamedTuple:
     """Factory function to create QuoteNamedTuple with validation and type conversion.
@@ -328,26 +365,148 @@ def create_quote_nt(ticker_symbol: str, timestamp: float, source: str, exchange_
     if exchange_code is not None and not isinstance(exchange_code, str):
         raise TypeError(f"exchange_code must be a string or None, got {type(exchange_code)}")
     if exchange_code is not None:
-        exchange_code = exchange_code.strip() or None
-
-    # Prepare field values with validation
-    validated_data = {
-        'ticker_symbol': ticker_symbol.strip(),
-        'timestamp': float(timestamp),
-        'source': source,
-        'exchange_code': exchange_code
-    }
+        exchange_code = sys.intern(exchange_code.strip()) or None
+
+    # Prepare field values positionally; omitted fields stay None. The labels
+    # repeat across millions of quotes, so interning lets them share one object;
+    # sys.intern only takes exact str, not subclasses such as numpy.str_
+    values = [sys.intern(ticker_symbol.strip()), float(timestamp), sys.intern(str(source)), exchange_code]
+
+    # Process market data fields with type validation; unknown keys are ignored.
+    # The generated reader visits every field, which only pays off once a quote
+    # carries more than a few of them
+    if len(market_data) > _SPARSE_FIELD_LIMIT:
+        _read_market_data(values, market_data)
+    else:
+        values.extend(_EMPTY_MARKET_DATA)
+        for field_name in _MARKET_DATA_FIELD_SET & market_data.keys():
+            raw_value = market_data[field_name]
+            if raw_value is not None:
+                if type(raw_value) is not _FIELD_TYPES.get(field_name):
+                    raw_value = _validate_and_convert_value(field_name, raw_value)
+                values[_FIELD_INDEX[field_name]] = raw_value
+
+    return QuoteNamedTuple._make(values)
+
+
+def create_quotes_batch(frame: 'pd.DataFrame') -> List[QuoteNamedTuple]:
+    """Create QuoteNamedTuple instances from the rows of a DataFrame.
+
+    Column-wise counterpart of create_quote_nt for bulk loads: each column is
+    validated and converted as a whole, with every distinct value converted only
+    once, and the rows are then assembled with QuoteNamedTuple._make. Columns are
+    named like create_quote_nt's arguments; unknown columns are ignored and
+    null market data cells become None.
+
+    Args:
+        frame: DataFrame with ticker_symbol, timestamp and source columns, plus
+            optional exchange_code and market data field columns
+
+    Returns:
+        List of QuoteNamedTuple instances in row order
+
+    Raises:
+        TypeError: If a required column is missing or a value has the wrong type
+        ValueError: If a ticker_symbol is empty or a value cannot be converted
+
+    Examples:
+        >>> frame = pd.DataFrame({
+        ...     "ticker_symbol": ["VIC", "VIC"],
+        ...     "timestamp": [1704078000.0, 1704078060.0],
+        ...     "source": ["CSV", "CSV"],
+        ...     "ref_price": ["100.00", "100.00"],
+        ...     "bid_qty_1": [500, 300],
+        ... })
+        >>> quotes = create_quotes_batch(frame)
+    """
+    missing = [name for name in ('ticker_symbol', 'timestamp', 'source') if name not in frame.columns]
+    if missing:
+        raise TypeError(f"create_quotes_batch() missing required columns: {', '.join(missing)}")
+
+    columns = []
+    for field_name in QuoteNamedTuple._fields:
+        if field_name not in frame.columns:
+            columns.append(repeat(None))
+            continue
+
+        column = frame[field_name]
+        if field_name in _MARKET_DATA_FIELD_SET or field_name == 'exchange_code':
+            column = column.astype(object).where(column.notna(), None)
+        convert = _BATCH_CONVERTERS.get(field_name) or partial(_convert_market_value, field_name)
+        columns.append(_convert_column(column.tolist(), convert))
+
+    return list(map(QuoteNamedTuple._make, zip(*columns)))
+
+
+# Types whose equal values are interchangeable, so they can be keyed by value
+_VALUE_KEYED_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _column_key(value: Any) -> Tuple[type, Any]:
+    """Key under which _convert_column converts a cell only once.
+
+    Keyed by type as well, so 1, 1.0 and True are not merged in object columns.
+    Equal floats and Decimals can still differ (0.0 and -0.0, Decimal('100.0')
+    and Decimal('100.00')) and a signaling NaN cannot be hashed, so they are
+    keyed by repr; any other value is keyed by identity.
+    """
+    value_class = value.__class__
+    if value_class in _VALUE_KEYED_TYPES:
+        return value_class, value
+    if value_class is float or value_class is Decimal:
+        return value_class, repr(value)
+    return value_class, id(value)
+
+
+def _convert_column(values: List[Any], convert: Callable[[Any], Any]) -> List[Any]:
+    """Convert each distinct value of a column once and map the rows through the results."""
+    keys = list(map(_column_key, values))
+    converted = {key: convert(value) for key, value in dict(zip(keys, values)).items()}
+    return [converted[key] for key in keys]
+
+
+def _convert_ticker_symbol(value: Any) -> str:
+    """Validate and normalize a ticker_symbol cell as create_quote_nt does."""
+    if not isinstance(value, str):
+        raise TypeError(f"ticker_symbol must be a string, got {type(value)}")
+    if not value or not value.strip():
+        raise ValueError("ticker_symbol cannot be empty")
+    return sys.intern(value.strip())
+
+
+def _convert_timestamp(value: Any) -> float:
+    """Validate and normalize a timestamp cell as create_quote_nt does."""
+    if not isinstance(value, (int, float)):
+        raise TypeError(f"timestamp must be a number, got {type(value)}")
+    return float(value)
+
+
+def _convert_source(value: Any) -> str:
+    """Validate a source cell as create_quote_nt does."""
+    if not isinstance(value, str):
+        raise TypeError(f"source must be a string, got {type(value)}")
+    return sys.intern(str(value))
+
+
+def _convert_exchange_code(value: Any) -> Optional[str]:
+    """Validate and normalize an exchange_code cell as create_quote_nt does."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise TypeError(f"exchange_code must be a string or None, got {type(value)}")
+    return sys.intern(value.strip()) or None
+
 
-    # Process market data fields with type validation
-    for field_name, raw_value in market_data.items():
-        if raw_value is not None and field_name in QuoteNamedTuple._fields:
-            validated_data[field_name] = _validate_and_convert_value(field_name, raw_value)
-        elif field_name in QuoteNamedTuple._fields:
-            validated_data[field_name] = None
+def _convert_market_value(field_name: str, value: Any) -> Any:
+    """Validate and convert a market data cell, passing None and already-typed values through."""
+    if value is None or type(value) is _FIELD_TYPES.get(field_name):
+        return value
+    return _validate_and_convert_value(field_name, value)
 
-    # Fill in None for any missing optional fields
-    for field_name in QuoteNamedTuple._fields[4:]:  # Skip the 4 required fields (ticker_symbol, timestamp, source, exchange_code)
-        if field_name not in validated_data:
-            validated_data[field_name] = None
 
-    return QuoteNamedTuple(**validated_data)
+_BATCH_CONVERTERS = {
+    'ticker_symbol': _convert_ticker_symbol,
+    'timestamp': _convert_timestamp,
+    'source': _convert_source,
+    'exchange_code': _convert_exchange_code,
+}
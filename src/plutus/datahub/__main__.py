@@ -228,15 +228,18 @@ def output_json(results, output_path: Optional[str], limit: Optional[int], quiet
                 json_row[key] = value
         json_rows.append(json_row)
 
+    # Encode in one piece: json.dump would make a write() call per token
+    json_text = json.dumps(json_rows, indent=2)
+
     # Write JSON
     if output_path:
         with open(output_path, 'w') as f:
-            json.dump(json_rows, f, indent=2)
+            f.write(json_text)
         if not quiet:
             print(f"✓ Wrote {len(json_rows):,} rows to {output_path}", file=sys.stderr)
     else:
         # Print to stdout
-        json.dump(json_rows, sys.stdout, indent=2)
+        sys.stdout.write(json_text)
         print()  # Newline
 
 
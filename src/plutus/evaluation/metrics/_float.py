@@ -0,0 +1,29 @@
+"""Float helpers shared by the metric functions and PerformanceEvaluator.
+
+Decimal stays the type of metric inputs and results, but the ratio and
+deviation metrics compute in float: inputs are converted with float() on the
+way in and results go back through to_decimal on the way out.
+"""
+
+import math
+from decimal import Decimal
+from typing import List
+
+
+def sample_stdev(values: List[float], mean: float) -> float:
+    """Sample standard deviation around a precomputed mean (two-pass, fsum).
+
+    Avoids the exact-fraction arithmetic of statistics.stdev. A constant series
+    gives exactly 0.0, as statistics.stdev does, so callers can test for it.
+    """
+    if min(values) == max(values):
+        return 0.0
+    return math.sqrt(math.fsum([(x - mean) ** 2 for x in values]) / (len(values) - 1))
+
+
+def to_decimal(value: float) -> Decimal:
+    """Convert a float result to Decimal through its shortest repr (0.1 -> Decimal('0.1')).
+
+    NumPy scalars are accepted and converted to float first.
+    """
+    return Decimal(repr(float(value)))
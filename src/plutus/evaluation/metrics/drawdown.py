@@ -7,6 +7,9 @@ average drawdown, and drawdown duration analysis.
 from decimal import Decimal
 from typing import List, Tuple
 
+_D_ZERO = Decimal('0')
+_D_ONE = Decimal('1')
+
 
 def maximum_drawdown(returns: List[Decimal]) -> Decimal:
     """Calculate maximum drawdown (optimized O(n) algorithm).
@@ -30,16 +33,16 @@ def maximum_drawdown(returns: List[Decimal]) -> Decimal:
         >>> maximum_drawdown(returns)
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Build cumulative returns
-    cumulative = [Decimal('1')]
+    cumulative = [_D_ONE]
     for r in returns:
-        cumulative.append(cumulative[-1] * (Decimal('1') + r))
+        cumulative.append(cumulative[-1] * (_D_ONE + r))
 
     # Single-pass algorithm
-    max_so_far = Decimal('1')
-    max_drawdown = Decimal('0')
+    max_so_far = _D_ONE
+    max_drawdown = _D_ZERO
 
     for value in cumulative:
         max_so_far = max(max_so_far, value)
@@ -68,16 +71,16 @@ def average_drawdown(returns: List[Decimal]) -> Decimal:
         >>> average_drawdown(returns)
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Build cumulative returns
-    cumulative = [Decimal('1')]
+    cumulative = [_D_ONE]
     for r in returns:
-        cumulative.append(cumulative[-1] * (Decimal('1') + r))
+        cumulative.append(cumulative[-1] * (_D_ONE + r))
 
     # Calculate drawdown at each point
     drawdowns = []
-    max_so_far = Decimal('1')
+    max_so_far = _D_ONE
 
     for value in cumulative:
         max_so_far = max(max_so_far, value)
@@ -86,7 +89,7 @@ def average_drawdown(returns: List[Decimal]) -> Decimal:
             drawdowns.append(drawdown)
 
     if len(drawdowns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Return average
     return sum(drawdowns) / Decimal(str(len(drawdowns)))
@@ -111,16 +114,16 @@ def average_drawdown_duration(returns: List[Decimal]) -> Decimal:
         >>> average_drawdown_duration(returns)
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Build cumulative returns
-    cumulative = [Decimal('1')]
+    cumulative = [_D_ONE]
     for r in returns:
-        cumulative.append(cumulative[-1] * (Decimal('1') + r))
+        cumulative.append(cumulative[-1] * (_D_ONE + r))
 
     # Track drawdown durations
     durations = []
-    max_so_far = Decimal('1')
+    max_so_far = _D_ONE
     max_index = 0
     in_drawdown = False
     drawdown_start = 0
@@ -144,7 +147,7 @@ def average_drawdown_duration(returns: List[Decimal]) -> Decimal:
         durations.append(len(cumulative) - 1 - drawdown_start)
 
     if len(durations) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Return average duration
     return Decimal(str(sum(durations))) / Decimal(str(len(durations)))
@@ -172,13 +175,13 @@ def longest_drawdown_duration(returns: List[Decimal]) -> int:
         return 0
 
     # Build cumulative returns
-    cumulative = [Decimal('1')]
+    cumulative = [_D_ONE]
     for r in returns:
-        cumulative.append(cumulative[-1] * (Decimal('1') + r))
+        cumulative.append(cumulative[-1] * (_D_ONE + r))
 
     # Track longest duration
     longest_duration = 0
-    max_so_far = Decimal('1')
+    max_so_far = _D_ONE
     max_index = 0
 
     for i in range(1, len(cumulative)):
@@ -212,17 +215,17 @@ def get_drawdown_periods(returns: List[Decimal]) -> List[Tuple[int, int, Decimal
         return []
 
     # Build cumulative returns
-    cumulative = [Decimal('1')]
+    cumulative = [_D_ONE]
     for r in returns:
-        cumulative.append(cumulative[-1] * (Decimal('1') + r))
+        cumulative.append(cumulative[-1] * (_D_ONE + r))
 
     # Identify drawdown periods
     drawdown_periods = []
-    max_so_far = Decimal('1')
+    max_so_far = _D_ONE
     max_index = 0
     in_drawdown = False
     drawdown_start = 0
-    min_value = Decimal('1')
+    min_value = _D_ONE
 
     for i, value in enumerate(cumulative):
         if value > max_so_far:
@@ -4,10 +4,17 @@ This module implements industry-standard return metrics including
 risk-adjusted ratios and growth calculations.
 """
 
+import math
 import statistics
 from decimal import Decimal
 from typing import List, Optional
 
+from plutus.evaluation.metrics._float import sample_stdev, to_decimal
+
+_D_ZERO = Decimal('0')
+_D_ONE = Decimal('1')
+_D_INF = Decimal('Inf')
+
 
 def sharpe_ratio(
     returns: List[Decimal],
@@ -41,21 +48,22 @@ def sharpe_ratio(
         >>> returns = [Decimal('0.01'), Decimal('0.02'), Decimal('-0.01')]
         >>> sharpe_ratio(returns, risk_free_rate=Decimal('0.03'), annualization_factor=252)
     """
-    if len(returns) <= 1 or all(r == Decimal('0') for r in returns):
-        return Decimal('0')
+    if len(returns) <= 1 or all(r == _D_ZERO for r in returns):
+        return _D_ZERO
 
-    mean_return = statistics.mean(returns)
-    std_return = statistics.stdev(returns)
+    float_returns = [float(r) for r in returns]
+    mean_return = statistics.fmean(float_returns)
+    std_return = sample_stdev(float_returns, mean_return)
 
     if std_return == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Adjust risk-free rate to period frequency
-    period_rf_rate = risk_free_rate / Decimal(str(annualization_factor))
+    period_rf_rate = float(risk_free_rate) / annualization_factor
 
     # Calculate and annualize
-    return (
-        Decimal(str(annualization_factor)) ** Decimal('0.5') *
+    return to_decimal(
+        math.sqrt(annualization_factor) *
         (mean_return - period_rf_rate) / std_return
     )
 
@@ -88,25 +96,26 @@ def sortino_ratio(
     Example:
         >>> sortino_ratio(returns, min_acceptable_return=Decimal('0.07'), annualization_factor=252)
     """
-    if len(returns) <= 1 or all(r == Decimal('0') for r in returns):
-        return Decimal('0')
+    if len(returns) <= 1 or all(r == _D_ZERO for r in returns):
+        return _D_ZERO
 
-    mean_return = statistics.mean(returns)
+    float_returns = [float(r) for r in returns]
+    mean_return = statistics.fmean(float_returns)
 
     # Adjust MAR to period frequency
-    period_mar = min_acceptable_return / Decimal(str(annualization_factor))
+    period_mar = float(min_acceptable_return) / annualization_factor
 
     # Calculate downside deviation (only negative deviations from MAR)
-    downside_diffs = [min(Decimal('0'), r - period_mar) for r in returns]
-    downside_variance = statistics.mean([d ** 2 for d in downside_diffs])
-    downside_std = downside_variance ** Decimal('0.5')
+    downside_diffs = [min(0.0, r - period_mar) for r in float_returns]
+    downside_variance = statistics.fmean([d ** 2 for d in downside_diffs])
+    downside_std = math.sqrt(downside_variance)
 
     if downside_std == 0:
-        return Decimal('Inf') if mean_return > period_mar else Decimal('0')
+        return _D_INF if mean_return > period_mar else _D_ZERO
 
     # Calculate and annualize
-    return (
-        Decimal(str(annualization_factor)) ** Decimal('0.5') *
+    return to_decimal(
+        math.sqrt(annualization_factor) *
         (mean_return - period_mar) / downside_std
     )
 
@@ -143,7 +152,7 @@ def calmar_ratio(
     from plutus.evaluation.metrics.drawdown import maximum_drawdown
 
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Calculate CAGR
     cagr_value = cagr(returns, annualization_factor)
@@ -154,7 +163,7 @@ def calmar_ratio(
 
     # Avoid division by zero
     if max_dd == 0:
-        return Decimal('Inf') if cagr_value > 0 else Decimal('0')
+        return _D_INF if cagr_value > 0 else _D_ZERO
 
     # Calmar = CAGR / |Max DD|
     return cagr_value / abs(max_dd)
@@ -189,13 +198,13 @@ def omega_ratio(
         >>> omega_ratio(returns, threshold=Decimal('0.0'))
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
-    gains = sum([max(Decimal('0'), r - threshold) for r in returns])
-    losses = abs(sum([min(Decimal('0'), r - threshold) for r in returns]))
+    gains = sum([max(_D_ZERO, r - threshold) for r in returns])
+    losses = abs(sum([min(_D_ZERO, r - threshold) for r in returns]))
 
     if losses == 0:
-        return Decimal('Inf') if gains > 0 else Decimal('1.0')
+        return _D_INF if gains > 0 else Decimal('1.0')
 
     return gains / losses
 
@@ -233,23 +242,24 @@ def information_ratio(
         raise ValueError("Returns and benchmark_returns must have same length")
 
     if len(returns) <= 1:
-        return Decimal('0')
+        return _D_ZERO
 
-    # Calculate active returns (excess over benchmark)
-    active_returns = [r - b for r, b in zip(returns, benchmark_returns)]
+    # Calculate active returns (excess over benchmark); the difference is
+    # exact in Decimal, the statistics are computed in float
+    active_returns = [float(r - b) for r, b in zip(returns, benchmark_returns)]
 
-    if all(ar == Decimal('0') for ar in active_returns):
-        return Decimal('0')
+    if not any(active_returns):
+        return _D_ZERO
 
-    mean_active = statistics.mean(active_returns)
-    tracking_error = statistics.stdev(active_returns)
+    mean_active = statistics.fmean(active_returns)
+    tracking_error = sample_stdev(active_returns, mean_active)
 
     if tracking_error == 0:
-        return Decimal('Inf') if mean_active > 0 else Decimal('0')
+        return _D_INF if mean_active > 0 else _D_ZERO
 
     # Annualize
-    return (
-        Decimal(str(annualization_factor)) ** Decimal('0.5') *
+    return to_decimal(
+        math.sqrt(annualization_factor) *
         mean_active / tracking_error
     )
 
@@ -276,18 +286,18 @@ def cagr(
         >>> cagr(returns, annualization_factor=252)
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Calculate final cumulative return
-    cumulative = Decimal('1')
+    cumulative = _D_ONE
     for r in returns:
-        cumulative *= (Decimal('1') + r)
+        cumulative *= (_D_ONE + r)
 
     num_periods = len(returns)
 
     # Annualize: (cumulative) ^ (annualization_factor / periods) - 1
     exponent = Decimal(str(annualization_factor)) / Decimal(str(num_periods))
-    return cumulative ** exponent - Decimal('1')
+    return cumulative ** exponent - _D_ONE
 
 
 def total_return(returns: List[Decimal]) -> Decimal:
@@ -308,10 +318,10 @@ def total_return(returns: List[Decimal]) -> Decimal:
         >>> total_return(returns)
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
-    cumulative = Decimal('1')
+    cumulative = _D_ONE
     for r in returns:
-        cumulative *= (Decimal('1') + r)
+        cumulative *= (_D_ONE + r)
 
-    return cumulative - Decimal('1')
\ No newline at end of file
+    return cumulative - _D_ONE
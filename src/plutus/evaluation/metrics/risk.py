@@ -4,10 +4,15 @@ This module implements risk metrics including Value at Risk (VaR),
 Conditional VaR, and volatility measures.
 """
 
+import math
 import statistics
 from decimal import Decimal
 from typing import List
 
+from plutus.evaluation.metrics._float import sample_stdev, to_decimal
+
+_D_ZERO = Decimal('0')
+
 
 def value_at_risk(
     returns: List[Decimal],
@@ -37,7 +42,7 @@ def value_at_risk(
         >>> value_at_risk(returns, confidence_level=Decimal('0.99'))  # 99% VaR
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Sort returns in ascending order
     sorted_returns = sorted(returns)
@@ -79,7 +84,7 @@ def conditional_value_at_risk(
         >>> conditional_value_at_risk(returns, confidence_level=Decimal('0.95'))
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
     # Calculate VaR
     var = value_at_risk(returns, confidence_level)
@@ -121,12 +126,13 @@ def annualized_volatility(
         >>> annualized_volatility(returns, annualization_factor=252)
     """
     if len(returns) <= 1:
-        return Decimal('0')
+        return _D_ZERO
 
-    std_return = statistics.stdev(returns)
+    float_returns = [float(r) for r in returns]
+    std_return = sample_stdev(float_returns, statistics.fmean(float_returns))
 
     # Annualize volatility
-    return std_return * (Decimal(str(annualization_factor)) ** Decimal('0.5'))
+    return to_decimal(std_return * math.sqrt(annualization_factor))
 
 
 def downside_deviation(
@@ -158,15 +164,16 @@ def downside_deviation(
         >>> downside_deviation(returns, min_acceptable_return=Decimal('0.0'), annualization_factor=252)
     """
     if len(returns) == 0:
-        return Decimal('0')
+        return _D_ZERO
 
-    # Adjust MAR to period frequency
-    period_mar = min_acceptable_return / Decimal(str(annualization_factor))
+    # Adjust MAR to period frequency; computed in float, Decimal is kept for
+    # the inputs and the result
+    period_mar = float(min_acceptable_return) / annualization_factor
 
     # Calculate downside deviations (only negative deviations from MAR)
-    downside_diffs = [min(Decimal('0'), r - period_mar) for r in returns]
-    downside_variance = statistics.mean([d ** 2 for d in downside_diffs])
-    downside_std = downside_variance ** Decimal('0.5')
+    downside_diffs = [min(0.0, float(r) - period_mar) for r in returns]
+    downside_variance = statistics.fmean([d ** 2 for d in downside_diffs])
+    downside_std = math.sqrt(downside_variance)
 
     # Annualize
-    return downside_std * (Decimal(str(annualization_factor)) ** Decimal('0.5'))
\ No newline at end of file
+    return to_decimal(downside_std * math.sqrt(annualization_factor))
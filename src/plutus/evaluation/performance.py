@@ -7,12 +7,21 @@ for optimal performance.
 Version: 2.0.0 (Refactored)
 """
 
+import math
 import statistics
 from decimal import Decimal
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
 # Import metric functions from metrics module
 from plutus.evaluation import metrics
+from plutus.evaluation.metrics._float import to_decimal
+
+_D_ZERO = Decimal('0')
+_D_INF = Decimal('Inf')
+_D_95 = Decimal('0.95')
+_D_99 = Decimal('0.99')
 
 
 class PerformanceEvaluator:
@@ -76,6 +85,11 @@ class PerformanceEvaluator:
         self._return_std: Optional[Decimal] = None
         self._cumulative_performances: Optional[List[Decimal]] = None
 
+        # float64 copies the core metrics are computed on; Decimal stays the
+        # type of every public result
+        self._returns_array: Optional[np.ndarray] = None
+        self._cumulative_array: Optional[np.ndarray] = None
+
     @classmethod
     def from_returns(
         cls,
@@ -113,18 +127,43 @@ class PerformanceEvaluator:
             minimal_acceptable_return=min_acceptable_return
         )
 
+    @property
+    def returns_array(self) -> np.ndarray:
+        """Returns as a float64 array (converted once, cached)."""
+        if self._returns_array is None:
+            self._returns_array = np.fromiter(map(float, self.returns), dtype=np.float64, count=self.num_return)
+        return self._returns_array
+
+    @property
+    def cumulative_array(self) -> np.ndarray:
+        """Cumulative performances as a float64 array starting from 1.0 (cached)."""
+        if self._cumulative_array is None:
+            self._cumulative_array = np.concatenate(([1.0], np.cumprod(1.0 + self.returns_array)))
+        return self._cumulative_array
+
+    @property
+    def _ratios_undefined(self) -> bool:
+        """Whether Sharpe/Sortino are reported as 0: fewer than two returns or all zero (cached)."""
+        if 'ratios_undefined' not in self._cache:
+            self._cache['ratios_undefined'] = self.num_return <= 1 or not self.returns_array.any()
+        return self._cache['ratios_undefined']
+
     @property
     def return_mean(self) -> Decimal:
         """Mean of returns (computed on-demand, cached)."""
         if self._return_mean is None:
-            self._return_mean = statistics.mean(self.returns)
+            if self.num_return < 1:
+                raise statistics.StatisticsError('mean requires at least one data point')
+            self._return_mean = to_decimal(self.returns_array.mean())
         return self._return_mean
 
     @property
     def return_std(self) -> Decimal:
         """Standard deviation of returns (computed on-demand, cached)."""
         if self._return_std is None:
-            self._return_std = statistics.stdev(self.returns)
+            if self.num_return < 2:
+                raise statistics.StatisticsError('stdev requires at least two data points')
+            self._return_std = to_decimal(self.returns_array.std(ddof=1))
         return self._return_std
 
     @property
@@ -186,12 +225,13 @@ class PerformanceEvaluator:
         Returns:
             Annualized Sharpe ratio
         """
-        if len(self.returns) <= 1 or all(r == Decimal('0') for r in self.returns):
-            return Decimal('0')
+        if self._ratios_undefined:
+            return _D_ZERO
 
-        return (
-            self.annualized_factor**Decimal('0.5') *
-            (self.return_mean - risk_free_return/self.annualized_factor) / self.return_std
+        annualized_factor = float(self.annualized_factor)
+        return to_decimal(
+            math.sqrt(annualized_factor) *
+            (float(self.return_mean) - float(risk_free_return) / annualized_factor) / float(self.return_std)
         )
 
     def _get_sortino_ratio(self, minimal_acceptable_return: Decimal) -> Decimal:
@@ -203,19 +243,17 @@ class PerformanceEvaluator:
         Returns:
             Annualized Sortino ratio
         """
-        if len(self.returns) <= 1 or all(r == Decimal('0') for r in self.returns):
-            return Decimal('0')
+        if self._ratios_undefined:
+            return _D_ZERO
 
-        downside_deviation = (
-            statistics.mean(
-                [min(Decimal(0), r - minimal_acceptable_return / self.annualized_factor)**2 for r in self.returns]
-            ) ** Decimal('0.5')
-        )
-        return (
-            self.annualized_factor**Decimal('0.5') *
-            (self.return_mean - minimal_acceptable_return/self.annualized_factor) /
-            downside_deviation
-            if downside_deviation > 0 else Decimal('Inf')
+        annualized_factor = float(self.annualized_factor)
+        period_mar = float(minimal_acceptable_return) / annualized_factor
+        downside_deviation = math.sqrt(float(np.mean(np.minimum(0.0, self.returns_array - period_mar) ** 2)))
+        if not downside_deviation > 0:
+            return _D_INF
+
+        return to_decimal(
+            math.sqrt(annualized_factor) * (float(self.return_mean) - period_mar) / downside_deviation
         )
 
     def _get_cumulative_performances(self) -> List[Decimal]:
@@ -227,48 +265,36 @@ class PerformanceEvaluator:
         Returns:
             List of cumulative returns starting from 1.0
         """
-        cumulative_performances = [Decimal('1')]
-        for r in self.returns:
-            cumulative_performances.append(
-                cumulative_performances[-1] * (1 + r)
-            )
-        return cumulative_performances
+        return [to_decimal(value) for value in self.cumulative_array.tolist()]
 
     def _get_maximum_drawdown(self) -> Decimal:
-        """Compute maximum drawdown (optimized from O(n²) to O(n)).
+        """Compute maximum drawdown in one vectorized pass.
 
-        Uses pre-computed cumulative_performances property which is cached.
+        Uses the cached cumulative performances and their running peak.
 
         Returns:
             Maximum drawdown (negative value)
         """
-        # Single-pass algorithm instead of nested loops
-        max_so_far = Decimal('1')
-        max_drawdown = Decimal('0')
-
-        for value in self.cumulative_performances:
-            max_so_far = max(max_so_far, value)
-            drawdown = (value - max_so_far) / max_so_far
-            max_drawdown = min(max_drawdown, drawdown)
-
-        return max_drawdown
+        cumulative = self.cumulative_array
+        drawdowns = cumulative / np.maximum.accumulate(cumulative) - 1.0
+        return to_decimal(min(float(drawdowns.min()), 0.0))
 
     def _get_annual_return(self) -> Decimal:
         """Compute annual return (CAGR).
 
-        Uses pre-computed cumulative_performances property which is cached.
+        Uses the cached cumulative performances.
 
         Returns:
             Annualized return rate
         """
         return (
-            self.cumulative_performances[-1] ** (self.annualized_factor/self.num_return) - 1
+            to_decimal(self.cumulative_array[-1]) ** (self.annualized_factor/self.num_return) - 1
         )
 
     def _get_longest_drawdown_period(self) -> int:
         """Compute the longest drawdown period.
 
-        Uses pre-computed cumulative_performances property which is cached.
+        Uses the cached cumulative performances.
 
         Returns:
             Number of periods in longest drawdown
@@ -278,15 +304,17 @@ class PerformanceEvaluator:
         max_performance_index = 0
         min_performance = 1
 
-        for i in range(1, len(self.cumulative_performances)):
-            if self.cumulative_performances[i] > max_performance:
-                max_performance = self.cumulative_performances[i]
+        cumulative_performances = self.cumulative_array.tolist()
+        for i, performance in enumerate(cumulative_performances[1:], start=1):
+            if performance > max_performance:
+                max_performance = performance
                 min_performance = max_performance
                 max_performance_index = i
-            else:
-                if self.cumulative_performances[i] < min_performance:
-                    min_performance = self.cumulative_performances[i]
-                    longest_drawdown_period = max(longest_drawdown_period, i - max_performance_index)
+            elif performance < min_performance:
+                min_performance = performance
+                drawdown_period = i - max_performance_index
+                if drawdown_period > longest_drawdown_period:
+                    longest_drawdown_period = drawdown_period
 
         return longest_drawdown_period
 
@@ -340,7 +368,7 @@ class PerformanceEvaluator:
         if 'value_at_risk_95' not in self._cache:
             self._cache['value_at_risk_95'] = metrics.value_at_risk(
                 self.returns,
-                confidence_level=Decimal('0.95')
+                confidence_level=_D_95
             )
         return self._cache['value_at_risk_95']
 
@@ -350,7 +378,7 @@ class PerformanceEvaluator:
         if 'value_at_risk_99' not in self._cache:
             self._cache['value_at_risk_99'] = metrics.value_at_risk(
                 self.returns,
-                confidence_level=Decimal('0.99')
+                confidence_level=_D_99
             )
         return self._cache['value_at_risk_99']
 
@@ -360,7 +388,7 @@ class PerformanceEvaluator:
         if 'conditional_var_95' not in self._cache:
             self._cache['conditional_var_95'] = metrics.conditional_value_at_risk(
                 self.returns,
-                confidence_level=Decimal('0.95')
+                confidence_level=_D_95
             )
         return self._cache['conditional_var_95']
 
@@ -370,7 +398,7 @@ class PerformanceEvaluator:
         if 'conditional_var_99' not in self._cache:
             self._cache['conditional_var_99'] = metrics.conditional_value_at_risk(
                 self.returns,
-                confidence_level=Decimal('0.99')
+                confidence_level=_D_99
             )
         return self._cache['conditional_var_99']
 
@@ -420,6 +448,8 @@ class PerformanceEvaluator:
         self._return_mean = None
         self._return_std = None
         self._cumulative_performances = None
+        self._returns_array = None
+        self._cumulative_array = None
 
 
 # Backward compatibility alias (deprecated)
@@ -2,12 +2,10 @@ import datetime
 import os
 import time
 from decimal import Decimal
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import Any, Callable, List, TypeVar, Union, Optional
 
-import pytz
-
 from plutus.core.constant import VietnamMarketConstant
 
 def add_mins(tm, mins):
@@ -28,7 +26,7 @@ def get_delivery_date(symbol: str, timestamp: float, special_dates: List[str] =
     FIXME: calculate T + 2.5
     """
     delivery_date = datetime.datetime.fromtimestamp(
-        timestamp, tz=pytz.timezone("Asia/Ho_Chi_Minh")
+        timestamp, tz=VietnamMarketConstant.TIMEZONE
     )
 
     if "VN30F" in symbol:
@@ -117,14 +115,23 @@ def str_float_to_decimal(value: Optional[Union[float, str]], precision: int = 2)
     Otherwise, leave the value as is. The return value is not necessary a Decimal.
     """
     if isinstance(value, str):
-        if value == "None":
-            return None
-        else:
-            value = float(value)
+        return _str_to_decimal(value, precision)
 
     return round_decimal(value, precision) if isinstance(value, float) else value
 
 
+@lru_cache(maxsize=8192)
+def _str_to_decimal(value: str, precision: int) -> Optional[Decimal]:
+    """Memoized string branch of str_float_to_decimal.
+
+    Price strings repeat heavily within a session (reference, ceiling and floor
+    prices never change), and Decimal is immutable, so parsed values are shared.
+    """
+    if value == "None":
+        return None
+    return round_decimal(float(value), precision)
+
+
 def generate_tradable_quantity_key(common_key: str, symbol: str) -> str:
     return f"{common_key}:{symbol}:TRADABLE-QUANTITY"
 
@@ -147,14 +154,23 @@ def get_full_path_file(file_descriptor, relative_file_path):
 
 class Environment:
     """Defines the constants of the Vietnamese market"""
+    TIMEZONE = VietnamMarketConstant.TIMEZONE
+
     @staticmethod
     def get_current_time() -> datetime.datetime:
-        return datetime.datetime.now(tz=VietnamMarketConstant.TIMEZONE)
+        return datetime.datetime.now(tz=Environment.TIMEZONE)
 
     @staticmethod
     def sleep_until(until_time: datetime.time):
+        """Block until the given market time of the current day.
+
+        Sleeps for the remaining duration in one call instead of polling every
+        second; the loop only repeats if the sleep returns early.
+        """
         until_date_time = datetime.datetime.combine(
-            Environment.get_current_time().date(), until_time
-        ).astimezone(VietnamMarketConstant.TIMEZONE)
-        while until_date_time > Environment.get_current_time():
-            time.sleep(1)
+            Environment.get_current_time().date(), until_time, tzinfo=Environment.TIMEZONE
+        )
+        remaining = (until_date_time - Environment.get_current_time()).total_seconds()
+        while remaining > 0:
+            time.sleep(remaining)
+            remaining = (until_date_time - Environment.get_current_time()).total_seconds()
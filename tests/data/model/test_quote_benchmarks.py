@@ -0,0 +1,64 @@
+import time
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from plutus.data.model.quote_named_tuple import QuoteNamedTuple as QuoteNT, create_quote_nt
+
+
+# Micro-benchmarks for the quote models. They are timed by pytest-benchmark
+# rather than asserted against wall-clock limits, so a slow machine cannot fail
+# them; run with --benchmark-disable to execute each one once as a smoke test,
+# or deselect them with -m "not slow".
+
+TIMESTAMP = time.time()
+PRICES = tuple(Decimal(f"{100 + i}.50") for i in range(10))
+
+
+def _create_quotes():
+    return [
+        QuoteNT(
+            ticker_symbol="FPT",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            exchange_code="HSX",
+            ref_price=PRICES[i % 10],
+            latest_qty=1000 + i,
+        )
+        for i in range(1000)
+    ]
+
+
+@pytest.mark.slow
+def test_quote_nt_creation(benchmark):
+    quotes = benchmark(_create_quotes)
+    assert len(quotes) == 1000
+
+
+@pytest.mark.slow
+def test_create_quote_nt_factory(benchmark):
+    quote = benchmark(
+        create_quote_nt,
+        ticker_symbol="FPT",
+        timestamp=TIMESTAMP,
+        source="test_source",
+        exchange_code="HSX",
+        ref_price="100.50",
+        latest_qty=1000,
+    )
+    assert quote.ref_price == Decimal("100.50")
+
+
+@pytest.mark.slow
+def test_quote_nt_attribute_access(benchmark):
+    quotes = _create_quotes()
+
+    def access():
+        for quote in quotes:
+            _ = quote.ref_price
+            _ = quote.latest_qty
+            _ = quote.ticker_symbol
+
+    benchmark(access)
@@ -0,0 +1,358 @@
+import time
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+
+from plutus.data.model.enums import QuoteType
+from plutus.data.model.quote import Quote
+from plutus.data.model.quote_named_tuple import QuoteNamedTuple as QuoteNT, create_quote_nt
+
+
+# Shared by the structural tests, which only need a valid timestamp;
+# the round-trip test keeps a live time.time()
+TIMESTAMP = time.time()
+
+# Decimals reused across the tests, built once
+PRICE_100 = Decimal("100.0")
+PRICE_99_9 = Decimal("99.9")
+PRICE_101_2 = Decimal("101.2")
+PRICE_101_5 = Decimal("101.5")
+SETTLEMENT_PRICE = Decimal("1025.50")
+
+
+@pytest.fixture(scope="module")
+def basic_quote_data():
+    """Provides a read-only mapping of basic, valid quote data, built once per module.
+
+    Tests extend it with {**basic_quote_data, ...}, which makes a new dict.
+    """
+    return MappingProxyType({
+        "ticker_symbol": "FPT",
+        "timestamp": TIMESTAMP,
+        "source": "test_source",
+        "exchange_code": "HSX",
+    })
+
+
+@pytest.fixture(params=[(Quote, Quote), (QuoteNT, create_quote_nt)], ids=["quote", "namedtuple"])
+def quote_model(request):
+    """Provides (quote class, validating factory) for each Quote implementation."""
+    return request.param
+
+
+class TestQuoteShared:
+    """Behaviour both Quote implementations share; type-specific tests stay in
+    test_quote.py and test_quote_namedtuple.py."""
+
+    def test_successful_creation_and_type_coercion(self, quote_model, basic_quote_data):
+        """
+        Tests that a quote can be created with valid data and that type
+        conversion works correctly (e.g., string to Decimal).
+        """
+        _, factory = quote_model
+        full_data = {
+            **basic_quote_data,
+            "ref_price": "101.5",  # Should be converted to Decimal
+            "bid_qty_1": 1500,
+        }
+        quote = factory(**full_data)
+
+        assert quote.ticker_symbol == "FPT"
+        assert quote.exchange_code == "HSX"
+        assert quote.source == "test_source"
+        assert isinstance(quote.ref_price, Decimal)
+        assert quote.ref_price == PRICE_101_5
+        assert quote.bid_qty_1 == 1500
+        assert quote.floor_price is None  # Unset optional field should be None
+
+    def test_creation_with_input_price_as_float(self, quote_model, basic_quote_data):
+        """
+        Tests that a quote can be created with valid data but the price value is float not string
+        """
+        _, factory = quote_model
+        full_data = {
+            **basic_quote_data,
+            "ref_price": 101.5,  # Should be converted to Decimal
+            "bid_qty_1": 1500,
+        }
+        quote = factory(**full_data)
+
+        assert quote.ticker_symbol == "FPT"
+        assert quote.exchange_code == "HSX"
+        assert quote.source == "test_source"
+        assert isinstance(quote.ref_price, Decimal)
+        assert quote.ref_price == PRICE_101_5
+        assert quote.bid_qty_1 == 1500
+        assert quote.floor_price is None  # Unset optional field should be None
+
+    def test_creation_fails_with_missing_required_fields(self, quote_model):
+        """
+        Tests that TypeError is raised if required fields are missing.
+        """
+        cls, _ = quote_model
+        with pytest.raises(TypeError):
+            cls(timestamp=TIMESTAMP, source="test")
+
+        with pytest.raises(TypeError):
+            cls(ticker_symbol="FPT", source="test")
+
+        with pytest.raises(TypeError):
+            cls(ticker_symbol="FPT", timestamp=TIMESTAMP)
+
+    def test_creation_fails_with_invalid_data_type(self, quote_model, basic_quote_data):
+        """
+        Tests that ValueError is raised for incorrect data types that
+        cannot be coerced.
+        """
+        _, factory = quote_model
+        invalid_data = {**basic_quote_data, "ref_price": "not-a-decimal"}
+        with pytest.raises(ValueError):
+            factory(**invalid_data)
+
+    def test_attribute_access_dot_notation(self, quote_model, basic_quote_data):
+        """
+        Tests standard attribute access using dot notation.
+        """
+        _, factory = quote_model
+        quote = factory(**basic_quote_data, ref_price=PRICE_99_9)
+        assert quote.ref_price == PRICE_99_9
+        assert quote.ceiling_price is None
+
+    def test_attribute_access_getitem(self, quote_model, basic_quote_data):
+        """
+        Tests dictionary-style access using QuoteType enums.
+        """
+        _, factory = quote_model
+        quote = factory(
+            **basic_quote_data,
+            ref_price=PRICE_100,
+            latest_price=PRICE_101_2,
+        )
+        assert quote[QuoteType.REFERENCE] == PRICE_100
+        assert quote[QuoteType.LATEST_PRICE] == PRICE_101_2
+
+    def test_getitem_raises_error_for_invalid_key(self, quote_model, basic_quote_data):
+        """
+        Tests that __getitem__ raises a TypeError for non-QuoteType keys.
+        """
+        _, factory = quote_model
+        quote = factory(**basic_quote_data)
+        with pytest.raises(TypeError, match="Index must be a QuoteType enum member"):
+            _ = quote["ref_price"]  # Using a string instead of enum
+
+    def test_available_quote_types(self, quote_model, basic_quote_data):
+        """
+        Tests the available_quote_types method to ensure it lists only
+        populated fields.
+        """
+        _, factory = quote_model
+        # Test on a lean quote
+        lean_quote = factory(
+            **basic_quote_data,
+            ref_price=PRICE_100,
+            bid_qty_1=5000,
+        )
+        available = lean_quote.available_quote_types()
+        assert isinstance(available, list)
+        assert set(available) == {"ref_price", "bid_qty_1"}
+
+        # Test on a quote with only required fields
+        minimal_quote = factory(**basic_quote_data)
+        assert minimal_quote.available_quote_types() == []
+
+    def test_serialization_to_dict(self, quote_model, basic_quote_data):
+        """
+        Tests the to_dict method for correct serialization format.
+        """
+        _, factory = quote_model
+        quote = factory(
+            **basic_quote_data,
+            ref_price=Decimal("105.5"),
+            bid_qty_1=2000,
+        )
+        quote_dict = quote.to_dict()
+
+        # Check core fields
+        assert quote_dict["ticker_symbol"] == "FPT"
+        assert quote_dict["exchange_code"] == "HSX"
+        assert quote_dict["source"] == "test_source"
+
+        # Check serialized market data
+        assert quote_dict["ref_price"] == "105.5"  # Decimal -> str
+        assert quote_dict["bid_qty_1"] == 2000
+
+        # Check that unset fields are not included
+        assert "floor_price" not in quote_dict
+
+    def test_deserialization_from_dict_and_round_trip(self, quote_model):
+        """
+        Tests the from_dict method and ensures a perfect round trip.
+        """
+        cls, _ = quote_model
+        original_data = {
+            "ticker_symbol": "FPT",
+            "exchange_code": "HSX",
+            "timestamp": time.time(),
+            "source": "round_trip_test",
+            "ref_price": "110.0",
+            "latest_price": "111.5",
+            "total_matched_qty": 500000,
+        }
+
+        # 1. Deserialize from dictionary
+        quote1 = cls.from_dict(original_data)
+
+        assert isinstance(quote1, cls)
+        assert quote1.ticker_symbol == "FPT"
+        assert quote1.exchange_code == "HSX"
+        assert quote1.ref_price == Decimal("110.0")
+        assert quote1.latest_price == Decimal("111.5")
+        assert quote1.total_matched_qty == 500000
+
+        # 2. Serialize it back
+        re_serialized_data = quote1.to_dict()
+
+        # 3. Deserialize again and check for equality
+        quote2 = cls.from_dict(re_serialized_data)
+        assert quote1 == quote2
+
+    def test_from_dict_no_side_effects(self, quote_model):
+        """
+        Tests that from_dict does not mutate its input dict.
+        """
+        cls, _ = quote_model
+        data_dict = {
+            "ticker_symbol": "FPT",
+            "exchange_code": "HSX",
+            "timestamp": TIMESTAMP,
+            "source": "side_effect_test",
+        }
+        original_dict = data_dict.copy()
+
+        # The first call succeeds and should NOT mutate data_dict
+        cls.from_dict(data_dict)
+
+        # Verify the dictionary wasn't mutated
+        assert data_dict == original_dict
+
+        # The second call should also succeed
+        cls.from_dict(data_dict)
+
+        # Dictionary should still be unchanged
+        assert data_dict == original_dict
+
+    def test_exchange_code_none_handling(self, quote_model):
+        """
+        Tests that quotes properly handle exchange_code=None.
+        """
+        cls, factory = quote_model
+        # Test 1: Create a quote without exchange_code (defaults to None)
+        quote1 = factory(
+            ticker_symbol="FPT",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            ref_price=PRICE_100
+        )
+        assert quote1.exchange_code is None
+
+        # Test 2: Create a quote with explicit exchange_code=None
+        quote2 = factory(
+            ticker_symbol="FPT",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            exchange_code=None,
+            ref_price=PRICE_100
+        )
+        assert quote2.exchange_code is None
+
+        # Test 3: Serialization with None exchange_code
+        quote_dict = quote1.to_dict()
+        assert 'exchange_code' not in quote_dict  # None should not be serialized
+
+        # Test 4: Deserialization without exchange_code field
+        data = {
+            "ticker_symbol": "FPT",
+            "timestamp": TIMESTAMP,
+            "source": "test",
+            "ref_price": "100.0"
+        }
+        quote3 = cls.from_dict(data)
+        assert quote3.exchange_code is None
+
+        # Test 5: Repr with None exchange_code should not show exchange_code
+        repr_str = repr(quote1)
+        assert "exchange_code=" not in repr_str
+
+    def test_settlement_price_and_open_interest(self, quote_model):
+        """
+        Tests that quotes properly handle futures-specific fields: settlement_price and open_interest.
+        """
+        cls, factory = quote_model
+        # Test 1: Create a quote with settlement_price (Decimal)
+        quote1 = factory(
+            ticker_symbol="VN30F2306",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            exchange_code="HNX",
+            settlement_price=SETTLEMENT_PRICE
+        )
+        assert quote1.settlement_price == SETTLEMENT_PRICE
+        assert isinstance(quote1.settlement_price, Decimal)
+
+        # Test 2: Create a quote with open_interest (int)
+        quote2 = factory(
+            ticker_symbol="VN30F2306",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            exchange_code="HNX",
+            open_interest=50000
+        )
+        assert quote2.open_interest == 50000
+        assert isinstance(quote2.open_interest, int)
+
+        # Test 3: Type conversion - settlement_price from string
+        quote3 = factory(
+            ticker_symbol="VN30F2306",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            exchange_code="HNX",
+            settlement_price="1030.75"
+        )
+        assert quote3.settlement_price == Decimal("1030.75")
+
+        # Test 4: Type conversion - open_interest from string
+        quote4 = factory(
+            ticker_symbol="VN30F2306",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            exchange_code="HNX",
+            open_interest="75000"
+        )
+        assert quote4.open_interest == 75000
+
+        # Test 5: Serialization includes both fields
+        quote5 = factory(
+            ticker_symbol="VN30F2306",
+            timestamp=TIMESTAMP,
+            source="test_source",
+            exchange_code="HNX",
+            settlement_price=SETTLEMENT_PRICE,
+            open_interest=50000
+        )
+        quote_dict = quote5.to_dict()
+        assert quote_dict['settlement_price'] == '1025.50'
+        assert quote_dict['open_interest'] == 50000
+
+        # Test 6: Deserialization from dict
+        data = {
+            "ticker_symbol": "VN30F2306",
+            "exchange_code": "HNX",
+            "timestamp": TIMESTAMP,
+            "source": "test",
+            "settlement_price": "1025.50",
+            "open_interest": 50000
+        }
+        quote6 = cls.from_dict(data)
+        assert quote6.settlement_price == SETTLEMENT_PRICE
+        assert quote6.open_interest == 50000
@@ -5,17 +5,46 @@ CSV files into Quote objects. It covers various CSV formats, error handling,
 and integration with the sample data.
 """
 
+import io
 import pytest
 import tempfile
 import os
 from decimal import Decimal
 from pathlib import Path
 
+import pyarrow as pa
+
 from plutus.data.csv_interface import CSVQuoteReader, CSVQuoteBatchProcessor
 # Removed: from plutus.core.instrument import Instrument
 from plutus.data.model.quote import Quote
 
 
+# Decimals reused across the tests, built once
+PRICE_95_40 = Decimal('95.40')
+PRICE_96_25 = Decimal('96.25')
+
+# Sample data location, resolved and checked once at import
+SAMPLE_DATA_DIR = Path(__file__).parent.parent / "sample_data"
+HAS_SAMPLE_DATA = SAMPLE_DATA_DIR.exists()
+
+
+@pytest.fixture
+def write_quote_csv(tmp_path):
+    """Return a function that writes a CSV body to tmp_path under a quote file name."""
+    def write(file_name, body):
+        file_path = tmp_path / file_name
+        file_path.write_text(body)
+        return file_path
+    return write
+
+
+def quote_values(quote):
+    """A quote's labels and set market data fields, for comparison with expected values."""
+    return quote.ticker_symbol, quote.exchange_code, {
+        field: getattr(quote, field) for field in quote.available_quote_types()
+    }
+
+
 class TestCSVQuoteReader:
     """Test cases for CSVQuoteReader class."""
 
@@ -79,6 +108,48 @@ class TestCSVQuoteReader:
                 assert result is not None  # Just check that parsing succeeded
                 assert isinstance(result, float)
 
+    def test_parse_timestamp_column_matches_parse_timestamp(self):
+        """Test that the vectorized timestamp parser agrees with parse_timestamp."""
+        values = [
+            "2023-06-15 09:30:00", "2023-06-15 09:30:00.5", "2023-06-15 09:30:00.123456",
+            "2023-06-15", "2023-06-15 09:30:00+07:00", " 2023-06-15 09:30:00 ",
+            "2023-02-30 09:30:00", "2023-06-15 09:30:60", "2023-06-15 24:00:00",
+            "0001-01-01", "2023-06-15T09:30:00", "invalid", "", None,
+        ]
+        parsed = self.reader._parse_timestamp_column(pa.array(values, pa.string())).to_pylist()
+        assert parsed == [self.reader.parse_timestamp(value) for value in values]
+
+    def test_canonical_wall_clock_rejects_rolled_over_fields(self):
+        """Test that Arrow times whose fields do not read back as written are null."""
+        values = ["2023-06-15 09:30:00.5", "2023-02-30", "2023-06-15 09:60:00", "2023-06-15 09:30:60", "invalid"]
+        wall_clock, microseconds = self.reader._canonical_wall_clock(pa.array(values, pa.string()))
+        assert wall_clock.is_valid().to_pylist() == [True, False, False, False, False]
+        assert microseconds[0].as_py() == 500000
+
+    def test_field_groups(self):
+        """Test that depth files group rows by the Quote field their depth selects."""
+        def depth_column(*depths):
+            return {'depth': pa.array(depths, pa.string())}
+
+        assert self.reader._field_groups('quote_bidprice', depth_column('2', '', '11', '2')) == {
+            'bid_price_2': [0, 3], 'bid_price_1': [1], None: [2]
+        }
+        assert self.reader._field_groups('quote_bidprice', depth_column('3', '3')) == {'bid_price_3': None}
+        assert self.reader._field_groups('quote_bidprice', {}) == {'bid_price_1': None}
+        assert self.reader._field_groups('quote_open', depth_column('2')) == {'open_price': None}
+        # A negative depth names no Quote field: the row loop reports it
+        assert self.reader._field_groups('quote_bidprice', depth_column('1', '-1')) is None
+
+    def test_parse_integer_column_matches_parse_integer(self):
+        """Test that the vectorized integer parser agrees with parse_integer."""
+        values = [
+            "1000", "-7", "007", "123.7", "-3.9", "  42  ", "+5", "1_000",
+            "0x10", "99999999999999999999", "invalid", "", "1000",
+            "inf", "-inf", "nan", "1e999",
+        ]
+        parsed = self.reader._parse_integer_column(pa.array(values, pa.string()))
+        assert parsed == [self.reader.parse_integer(value) for value in values]
+
     def test_parse_decimal_values(self):
         """Test decimal value parsing."""
         test_cases = [
@@ -94,6 +165,13 @@ class TestCSVQuoteReader:
             result = self.reader.parse_decimal(value_str)  # Changed from _parse_decimal
             assert result == expected
 
+    def test_parse_float_matches_parse_decimal(self):
+        """Test that the columnar float parser accepts what parse_decimal accepts."""
+        for value_str in ('123.45', '0.0001', '', '   ', 'invalid', '  150.25  ', '1_000.5', '_1', '1e-3'):
+            decimal_value = self.reader.parse_decimal(value_str)
+            expected = None if decimal_value is None else float(decimal_value)
+            assert self.reader._parse_float(value_str) == expected
+
     def test_parse_integer_values(self):
         """Test integer value parsing."""
         test_cases = [
@@ -104,51 +182,37 @@ class TestCSVQuoteReader:
             ('', None),
             ('invalid', None),
             ('  42  ', 42),  # With whitespace
+            ('inf', None),  # Out of int range
+            ('1e999', None),  # Out of float range
         ]
 
         for value_str, expected in test_cases:
             result = self.reader.parse_integer(value_str)  # Changed from _parse_integer
             assert result == expected
 
-    def test_create_temp_csv_file(self):
-        """Helper method to create temporary CSV files for testing."""
-        def create_temp_csv(content: str) -> str:
-            fd, path = tempfile.mkstemp(suffix='.csv')
-            with os.fdopen(fd, 'w') as f:
-                f.write(content)
-            return path
-
-        # Test with quote_open.csv format
+    def test_read_csv_stream(self):
+        """Test reading quote_open.csv format data from an in-memory stream."""
         csv_content = """datetime,tickersymbol,price
 2023-06-15,VIC,96.25
 2023-06-15,HPG,43.05
 2023-06-16,VIC,96.85"""
 
-        temp_file = create_temp_csv(csv_content)
-        try:
-            # Rename to match expected pattern
-            temp_path = Path(temp_file)
-            new_path = temp_path.parent / "quote_open.csv"
-            temp_path.rename(new_path)
-
-            quotes = self.reader.read_csv_file(new_path)
-            assert len(quotes) == 3
+        quotes = self.reader.read_csv_stream(io.StringIO(csv_content), 'quote_open')
+        assert len(quotes) == 3
 
-            # Check first quote
-            quote = quotes[0]
-            assert quote.ticker_symbol == "VIC"
-            assert quote.open_price == Decimal('96.25')
-            assert quote.source == "CSV"
+        # Check first quote
+        quote = quotes[0]
+        assert quote.ticker_symbol == "VIC"
+        assert quote.open_price == PRICE_96_25
+        assert quote.source == "CSV"
 
-            # Check second quote
-            quote = quotes[1]
-            assert quote.ticker_symbol == "HPG"
-            assert quote.open_price == Decimal('43.05')
+        # Check second quote
+        quote = quotes[1]
+        assert quote.ticker_symbol == "HPG"
+        assert quote.open_price == Decimal('43.05')
 
-        finally:
-            # Clean up
-            if new_path.exists():
-                new_path.unlink()
+        with pytest.raises(ValueError):
+            self.reader.read_csv_stream(io.StringIO(csv_content), 'quote_ticker')
 
     def test_read_csv_file_not_found(self):
         """Test reading non-existent CSV file."""
@@ -174,7 +238,7 @@ class TestCSVQuoteReader:
         quote_kwargs = {}
 
         self.reader._parse_simple_field('quote_open', row, quote_kwargs)
-        assert quote_kwargs['open_price'] == Decimal('96.25')
+        assert quote_kwargs['open_price'] == PRICE_96_25
 
     def test_parse_simple_field_quantity(self):
         """Test parsing simple quantity fields."""
@@ -195,7 +259,7 @@ class TestCSVQuoteReader:
         quote_kwargs = {}
 
         self.reader._parse_depth_field('quote_bidprice', row, quote_kwargs)
-        assert quote_kwargs['bid_price_1'] == Decimal('96.25')
+        assert quote_kwargs['bid_price_1'] == PRICE_96_25
 
     def test_parse_csv_row_empty(self):
         """Test parsing empty CSV row."""
@@ -249,7 +313,7 @@ class TestCSVQuoteBatchProcessor:
     def test_get_statistics_with_data(self):
         """Test statistics generation with sample data."""
         # Create mock quotes
-        quote1 = Quote("VIC", 1686787200.0, "CSV", exchange_code="HSX", open_price=Decimal('96.25'))
+        quote1 = Quote("VIC", 1686787200.0, "CSV", exchange_code="HSX", open_price=PRICE_96_25)
         quote2 = Quote("VIC", 1686787200.0, "CSV", exchange_code="HSX", close_price=Decimal('96.50'))
 
         results = {
@@ -281,14 +345,13 @@ class TestCSVIntegrationWithSampleData:
     def setup_method(self):
         """Set up test fixtures."""
         self.reader = CSVQuoteReader()
-        self.sample_data_path = Path(__file__).parent.parent.parent / "tests" / "sample_data" / "csv"
+        self.sample_data_path = SAMPLE_DATA_DIR / "csv"
 
     def test_sample_data_directory_exists(self):
         """Test that sample data directory exists."""
         assert self.sample_data_path.exists(), f"Sample data directory not found: {self.sample_data_path}"
 
-    @pytest.mark.skipif(not Path(__file__).parent.parent.parent.joinpath("tests", "sample_data").exists(),
-                       reason="Sample data directory not found")
+    @pytest.mark.skipif(not HAS_SAMPLE_DATA, reason="Sample data directory not found")
     def test_read_quote_open_sample(self):
         """Test reading actual quote_open.csv sample file."""
         file_path = self.sample_data_path / "quote_open.csv"
@@ -301,8 +364,7 @@ class TestCSVIntegrationWithSampleData:
                 assert hasattr(quote, 'open_price')
                 assert quote.source == "CSV"
 
-    @pytest.mark.skipif(not Path(__file__).parent.parent.parent.joinpath("tests", "sample_data").exists(),
-                       reason="Sample data directory not found")
+    @pytest.mark.skipif(not HAS_SAMPLE_DATA, reason="Sample data directory not found")
     def test_read_quote_high_sample(self):
         """Test reading actual quote_high.csv sample file."""
         file_path = self.sample_data_path / "quote_high.csv"
@@ -314,8 +376,7 @@ class TestCSVIntegrationWithSampleData:
                 assert isinstance(quote, Quote)
                 assert hasattr(quote, 'highest_price')
 
-    @pytest.mark.skipif(not Path(__file__).parent.parent.parent.joinpath("tests", "sample_data").exists(),
-                       reason="Sample data directory not found")
+    @pytest.mark.skipif(not HAS_SAMPLE_DATA, reason="Sample data directory not found")
     def test_batch_process_sample_data(self):
         """Test batch processing of sample data directory."""
         if self.sample_data_path.exists():
@@ -333,6 +394,145 @@ class TestCSVIntegrationWithSampleData:
             assert 'total_quotes' in stats
             assert 'file_statistics' in stats
 
+            # Worker processes give the same results in the same order
+            parallel = processor.process_sample_data(self.sample_data_path, max_workers=2)
+            assert list(parallel) == list(results)
+            assert parallel == results
+
+    def test_read_csv_directory_sample_data(self):
+        """Test reading the sample directory serially and with worker processes."""
+        serial = self.reader.read_csv_directory(self.sample_data_path)
+        parallel = self.reader.read_csv_directory(self.sample_data_path, max_workers=2)
+
+        # Metadata files are skipped, quote files keep directory order
+        assert 'quote_ticker.csv' not in serial
+        assert 'quote_open.csv' in serial
+        assert list(serial) == list(parallel)
+        assert serial == parallel
+
+    def test_read_csv_file_columnar_sample_data(self):
+        """Test that the columnar table holds the same rows as the Quote list."""
+        file_path = self.sample_data_path / "quote_matched.csv"
+        quotes = self.reader.read_csv_file(file_path)
+        table = self.reader.read_csv_file_columnar(file_path)
+
+        assert table.num_rows == len(quotes)
+        assert table.schema.field('latest_price').type == pa.float64()
+        assert pa.types.is_dictionary(table.schema.field('ticker_symbol').type)
+        assert [Quote.from_row(table, i) for i in range(table.num_rows)] == quotes
+
+        with pytest.raises(ValueError):
+            self.reader.read_csv_file_columnar(self.sample_data_path / "quote_bidprice.csv")
+
+    def test_read_csv_file_columnar_quantity_out_of_int64(self, write_quote_csv, capsys):
+        """Test that a quantity past int64's range becomes null instead of failing the table."""
+        file_path = write_quote_csv(
+            "quote_dailyvolume.csv",
+            "datetime,tickersymbol,quantity\n"
+            "2023-06-15,VIC,1500\n"
+            "2023-06-15,HPG,1e300\n"
+            "2023-06-15,FPT,inf\n"
+        )
+
+        table = self.reader.read_csv_file_columnar(file_path)
+
+        assert table.column('total_matched_qty').to_pylist() == [1500, None, None]
+        assert "does not fit int64" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("file_name, body", [
+        ("quote_open.csv",
+         "datetime,tickersymbol,price\n"
+         "2023-06-15,VIC,96.25\n"
+         "2023-06-15,HSX:,95.00\n"  # No symbol left: reported
+         "invalid_date,HSX:,95.00\n"  # No timestamp: skipped first, not reported
+         "2023-06-15,HPG,invalid_price\n"),
+        ("quote_dailyvolume.csv",
+         "datetime,tickersymbol,price\n"  # Prices Quote rejects for a quantity field
+         "2023-06-15,VIC,1500\n"
+         "2023-06-15,HSX:,300\n"),
+    ], ids=["prices", "prices_for_quantity_field"])
+    def test_columnar_reads_report_rows_like_row_parsing(self, write_quote_csv, capsys, file_name, body):
+        """Test that every read of a file prints the row parser's warnings for the rows it skips."""
+        file_path = write_quote_csv(file_name, body)
+
+        quotes = list(self.reader.iter_csv_file(file_path))
+        warnings = capsys.readouterr().out
+        assert warnings
+
+        assert self.reader.read_csv_file(file_path) == quotes
+        assert capsys.readouterr().out == warnings
+        assert self.reader.read_csv_file_columnar(file_path).num_rows == len(quotes)
+        assert capsys.readouterr().out == warnings
+
+    def test_iter_csv_file_matches_read_csv_file(self):
+        """Test that the streaming API yields the same quotes as the list API."""
+        for name in ("quote_matched.csv", "quote_bidprice.csv", "quote_foreignbuyvalue.csv"):
+            file_path = self.sample_data_path / name
+            assert list(self.reader.iter_csv_file(file_path)) == self.reader.read_csv_file(file_path)
+
+        streamed = list(self.reader.iter_csv_directory(self.sample_data_path))
+        batched = self.reader.read_csv_directory(self.sample_data_path)
+        assert streamed == [quote for quotes in batched.values() for quote in quotes]
+
+        with pytest.raises(ValueError):
+            self.reader.iter_csv_file(self.sample_data_path / "quote_ticker.csv")
+
+    @pytest.mark.parametrize("file_name, body, expected", [
+        ("quote_bidprice.csv",
+         "datetime,tickersymbol,price,depth\n"
+         "2023-06-15 09:30:00,VIC,95.40,2\n"
+         "2023-06-15 09:30:00,HSX:VIC,95.30,\n"  # Missing depth means level 1
+         "2023-06-15 09:30:00,VIC,95.20,11\n"  # Past level 10: quote without a value
+         "2023-06-15 09:30:00,VIC,invalid_price,3\n",
+         [("VIC", None, {'bid_price_2': PRICE_95_40}), ("VIC", "HSX", {'bid_price_1': Decimal('95.30')}),
+          ("VIC", None, {}), ("VIC", None, {})]),
+        ("quote_bidsize.csv",
+         "datetime,tickersymbol,quantity,depth\n"
+         "2023-06-15 09:30:00,VIC,1500,1\n"
+         "2023-06-15 09:30:00,VIC,inf,2\n"  # Overflowing size: quote without a value
+         "2023-06-15 09:30:00,VIC,300,1e999\n"  # Unparseable depth means level 1
+         "2023-06-15 09:30:00,VIC,700,3\n",
+         [("VIC", None, {'bid_qty_1': 1500}), ("VIC", None, {}), ("VIC", None, {'bid_qty_1': 300}),
+          ("VIC", None, {'bid_qty_3': 700})]),
+        ("quote_foreignbuyvalue.csv",
+         "datetime,tickersymbol,matched_vol,latest_price,value\n"
+         "2023-06-15 09:30:00,VIC,1500,95.40,143100\n"
+         "2023-06-15 09:30:00,HSX:VIC, 200 ,,19080\n"
+         "2023-06-15 09:30:00,VIC,,invalid_price,0\n"
+         "2023-06-15 09:30:00,VIC,1e999,95.50,0\n",  # Overflowing volume only loses itself
+         [("VIC", None, {'latest_price': PRICE_95_40, 'foreign_buy_qty': 1500}),
+          ("VIC", "HSX", {'foreign_buy_qty': 200}), ("VIC", None, {}),
+          ("VIC", None, {'latest_price': Decimal('95.50')})]),
+        ("quote_dailyvolume.csv",
+         "datetime,tickersymbol,quantity\n"
+         "2023-06-15,VIC,1500\n"
+         "2023-06-15,HPG,inf\n"  # Overflowing quantity only loses itself
+         "2023-06-15,FPT,1e999\n"
+         "2023-06-16,VIC,2000\n",
+         [("VIC", None, {'total_matched_qty': 1500}), ("HPG", None, {}), ("FPT", None, {}),
+          ("VIC", None, {'total_matched_qty': 2000})]),
+        ("quote_open.csv",
+         "datetime,tickersymbol,price\n"
+         "2023-06-15,VIC,96.25\n"
+         "\n"  # Blank line: no row number
+         "2023-06-15,HPG\n"  # Short row: quote without a value, as csv.DictReader reads it
+         "2023-06-15,FPT,95.00,\n"  # Long row: extra field ignored
+         "\n"
+         "2023-06-16,VIC,96.85,1,2\n",
+         [("VIC", None, {'open_price': PRICE_96_25}), ("HPG", None, {}),
+          ("FPT", None, {'open_price': Decimal('95.00')}), ("VIC", None, {'open_price': Decimal('96.85')})]),
+    ], ids=["depth", "depth_overflow", "multi_column", "quantity_overflow", "ragged_and_blank_rows"])
+    def test_read_csv_file_matches_row_parsing(self, write_quote_csv, capsys, file_name, body, expected):
+        """Test that files read columnar give the row parser's quotes, without falling back to it."""
+        file_path = write_quote_csv(file_name, body)
+
+        quotes = self.reader.read_csv_file(file_path)
+
+        assert [quote_values(quote) for quote in quotes] == expected
+        assert quotes == list(self.reader.iter_csv_file(file_path))
+        assert self.reader._read_columnar(file_path, file_path.stem) == quotes
+        assert capsys.readouterr().out == ""
+
     def test_field_mapping_completeness(self):
         """Test that all expected CSV file types have field mappings."""
         expected_mappings = [
@@ -346,27 +546,17 @@ class TestCSVIntegrationWithSampleData:
 
     def test_error_handling_malformed_csv(self):
         """Test error handling with malformed CSV data."""
-        # Create temporary malformed CSV
-        fd, path = tempfile.mkstemp(suffix='.csv', prefix='quote_open_')
-        try:
-            with os.fdopen(fd, 'w') as f:
-                f.write("datetime,tickersymbol,price\n")
-                f.write("invalid_date,VIC,invalid_price\n")  # Invalid row
-                f.write("2023-06-15,HPG,43.05\n")  # Valid row
-
-            temp_path = Path(path)
-            new_path = temp_path.parent / "quote_open.csv"
-            temp_path.rename(new_path)
-
-            # Should gracefully handle malformed data by skipping bad rows
-            quotes = self.reader.read_csv_file(new_path)
-            # Should only get 1 valid quote (the HPG row)
-            assert len(quotes) == 1
-            assert quotes[0].ticker_symbol == "HPG"
-
-        finally:
-            if new_path.exists():
-                new_path.unlink()
+        csv_content = (
+            "datetime,tickersymbol,price\n"
+            "invalid_date,VIC,invalid_price\n"  # Invalid row
+            "2023-06-15,HPG,43.05\n"  # Valid row
+        )
+
+        # Should gracefully handle malformed data by skipping bad rows
+        quotes = self.reader.read_csv_stream(io.StringIO(csv_content), 'quote_open')
+        # Should only get 1 valid quote (the HPG row)
+        assert len(quotes) == 1
+        assert quotes[0].ticker_symbol == "HPG"
 
     def test_csv_without_exchange_code(self):
         """Test CSV parsing when exchangeid column is missing or empty."""
@@ -7,6 +7,19 @@ import pytest
 from decimal import Decimal
 from plutus.evaluation import metrics
 
+# Decimals reused across the tests, built once
+ZERO = Decimal('0')
+CONFIDENCE_95 = Decimal('0.95')
+CONFIDENCE_99 = Decimal('0.99')
+ONE_PCT = Decimal('0.01')
+TWO_PCT = Decimal('0.02')
+THREE_PCT = Decimal('0.03')
+SEVEN_PCT = Decimal('0.07')
+MINUS_ONE_PCT = Decimal('-0.01')
+MINUS_TWO_PCT = Decimal('-0.02')
+MINUS_THREE_PCT = Decimal('-0.03')
+MINUS_FIVE_PCT = Decimal('-0.05')
+
 
 class TestReturnMetrics:
     """Tests for return-based metrics."""
@@ -15,28 +28,28 @@ class TestReturnMetrics:
     def simple_returns(self):
         """Simple test returns."""
         return [
-            Decimal('0.01'),
-            Decimal('0.02'),
-            Decimal('-0.01'),
-            Decimal('0.03'),
-            Decimal('-0.02'),
+            ONE_PCT,
+            TWO_PCT,
+            MINUS_ONE_PCT,
+            THREE_PCT,
+            MINUS_TWO_PCT,
         ]
 
     @pytest.fixture
     def positive_returns(self):
         """All positive returns."""
-        return [Decimal('0.01'), Decimal('0.02'), Decimal('0.03')]
+        return [ONE_PCT, TWO_PCT, THREE_PCT]
 
     @pytest.fixture
     def negative_returns(self):
         """All negative returns."""
-        return [Decimal('-0.01'), Decimal('-0.02'), Decimal('-0.03')]
+        return [MINUS_ONE_PCT, MINUS_TWO_PCT, MINUS_THREE_PCT]
 
     def test_sharpe_ratio_positive(self, simple_returns):
         """Test Sharpe ratio with mixed returns."""
         sharpe = metrics.sharpe_ratio(
             simple_returns,
-            risk_free_rate=Decimal('0.03'),
+            risk_free_rate=THREE_PCT,
             annualization_factor=252
         )
         assert isinstance(sharpe, Decimal)
@@ -44,15 +57,15 @@ class TestReturnMetrics:
 
     def test_sharpe_ratio_zero_returns(self):
         """Test Sharpe ratio with all zero returns."""
-        returns = [Decimal('0'), Decimal('0'), Decimal('0')]
+        returns = [ZERO, ZERO, ZERO]
         sharpe = metrics.sharpe_ratio(returns)
-        assert sharpe == Decimal('0')
+        assert sharpe == ZERO
 
     def test_sortino_ratio_positive(self, simple_returns):
         """Test Sortino ratio with mixed returns."""
         sortino = metrics.sortino_ratio(
             simple_returns,
-            min_acceptable_return=Decimal('0.0'),
+            min_acceptable_return=ZERO,
             annualization_factor=252
         )
         assert isinstance(sortino, Decimal)
@@ -61,11 +74,11 @@ class TestReturnMetrics:
         """Test Sortino ratio with all positive returns."""
         sortino = metrics.sortino_ratio(
             positive_returns,
-            min_acceptable_return=Decimal('0.0'),
+            min_acceptable_return=ZERO,
             annualization_factor=252
         )
         # With all returns above MAR, sortino should be very high or Inf
-        assert sortino >= Decimal('0')
+        assert sortino >= ZERO
 
     def test_calmar_ratio(self, simple_returns):
         """Test Calmar ratio."""
@@ -78,7 +91,7 @@ class TestReturnMetrics:
 
     def test_calmar_ratio_with_provided_dd(self, simple_returns):
         """Test Calmar ratio with provided max drawdown."""
-        max_dd = Decimal('-0.05')
+        max_dd = MINUS_FIVE_PCT
         calmar = metrics.calmar_ratio(
             simple_returns,
             max_dd=max_dd,
@@ -88,21 +101,21 @@ class TestReturnMetrics:
 
     def test_omega_ratio_positive(self, positive_returns):
         """Test Omega ratio with positive returns."""
-        omega = metrics.omega_ratio(positive_returns, threshold=Decimal('0.0'))
+        omega = metrics.omega_ratio(positive_returns, threshold=ZERO)
         # All returns above threshold, should be very high or Inf
         assert omega >= Decimal('1.0')
 
     def test_omega_ratio_negative(self, negative_returns):
         """Test Omega ratio with negative returns."""
-        omega = metrics.omega_ratio(negative_returns, threshold=Decimal('0.0'))
+        omega = metrics.omega_ratio(negative_returns, threshold=ZERO)
         # All returns below threshold, should be 0
-        assert omega == Decimal('0')
+        assert omega == ZERO
 
     def test_omega_ratio_mixed(self, simple_returns):
         """Test Omega ratio with mixed returns."""
-        omega = metrics.omega_ratio(simple_returns, threshold=Decimal('0.0'))
+        omega = metrics.omega_ratio(simple_returns, threshold=ZERO)
         assert isinstance(omega, Decimal)
-        assert omega >= Decimal('0')
+        assert omega >= ZERO
 
     def test_information_ratio(self, simple_returns):
         """Test Information ratio."""
@@ -121,11 +134,11 @@ class TestReturnMetrics:
             simple_returns,  # Same as benchmark
             annualization_factor=252
         )
-        assert ir == Decimal('0')
+        assert ir == ZERO
 
     def test_information_ratio_length_mismatch(self, simple_returns):
         """Test Information ratio with mismatched lengths."""
-        benchmark_returns = [Decimal('0.01')] * 3
+        benchmark_returns = [ONE_PCT] * 3
         with pytest.raises(ValueError, match="same length"):
             metrics.information_ratio(simple_returns, benchmark_returns)
 
@@ -133,35 +146,35 @@ class TestReturnMetrics:
         """Test CAGR with positive returns."""
         cagr_value = metrics.cagr(positive_returns, annualization_factor=252)
         assert isinstance(cagr_value, Decimal)
-        assert cagr_value > Decimal('0')
+        assert cagr_value > ZERO
 
     def test_cagr_negative(self, negative_returns):
         """Test CAGR with negative returns."""
         cagr_value = metrics.cagr(negative_returns, annualization_factor=252)
         assert isinstance(cagr_value, Decimal)
-        assert cagr_value < Decimal('0')
+        assert cagr_value < ZERO
 
     def test_cagr_empty(self):
         """Test CAGR with empty returns."""
         cagr_value = metrics.cagr([], annualization_factor=252)
-        assert cagr_value == Decimal('0')
+        assert cagr_value == ZERO
 
     def test_total_return_positive(self, positive_returns):
         """Test total return with positive returns."""
         total = metrics.total_return(positive_returns)
         assert isinstance(total, Decimal)
-        assert total > Decimal('0')
+        assert total > ZERO
 
     def test_total_return_negative(self, negative_returns):
         """Test total return with negative returns."""
         total = metrics.total_return(negative_returns)
         assert isinstance(total, Decimal)
-        assert total < Decimal('0')
+        assert total < ZERO
 
     def test_total_return_empty(self):
         """Test total return with empty returns."""
         total = metrics.total_return([])
-        assert total == Decimal('0')
+        assert total == ZERO
 
 
 class TestRiskMetrics:
@@ -171,60 +184,60 @@ class TestRiskMetrics:
     def returns_with_outliers(self):
         """Returns with extreme values."""
         return [
-            Decimal('0.01'), Decimal('0.02'), Decimal('-0.01'),
-            Decimal('-0.05'), Decimal('0.03'), Decimal('-0.10'),
-            Decimal('0.01'), Decimal('0.02'), Decimal('-0.02'),
-            Decimal('0.01')
+            ONE_PCT, TWO_PCT, MINUS_ONE_PCT,
+            MINUS_FIVE_PCT, THREE_PCT, Decimal('-0.10'),
+            ONE_PCT, TWO_PCT, MINUS_TWO_PCT,
+            ONE_PCT
         ]
 
     def test_value_at_risk_95(self, returns_with_outliers):
         """Test VaR at 95% confidence."""
         var = metrics.value_at_risk(
             returns_with_outliers,
-            confidence_level=Decimal('0.95')
+            confidence_level=CONFIDENCE_95
         )
         assert isinstance(var, Decimal)
-        assert var < Decimal('0')  # VaR should be negative (a loss)
+        assert var < ZERO  # VaR should be negative (a loss)
 
     def test_value_at_risk_99(self, returns_with_outliers):
         """Test VaR at 99% confidence."""
         var = metrics.value_at_risk(
             returns_with_outliers,
-            confidence_level=Decimal('0.99')
+            confidence_level=CONFIDENCE_99
         )
         assert isinstance(var, Decimal)
-        assert var < Decimal('0')  # VaR should be negative
+        assert var < ZERO  # VaR should be negative
 
     def test_var_99_worse_than_95(self, returns_with_outliers):
         """Test that 99% VaR is worse (more negative) than 95% VaR."""
-        var_95 = metrics.value_at_risk(returns_with_outliers, Decimal('0.95'))
-        var_99 = metrics.value_at_risk(returns_with_outliers, Decimal('0.99'))
+        var_95 = metrics.value_at_risk(returns_with_outliers, CONFIDENCE_95)
+        var_99 = metrics.value_at_risk(returns_with_outliers, CONFIDENCE_99)
         assert var_99 <= var_95  # 99% VaR should be <= (more negative)
 
     def test_value_at_risk_empty(self):
         """Test VaR with empty returns."""
-        var = metrics.value_at_risk([], confidence_level=Decimal('0.95'))
-        assert var == Decimal('0')
+        var = metrics.value_at_risk([], confidence_level=CONFIDENCE_95)
+        assert var == ZERO
 
     def test_conditional_var_95(self, returns_with_outliers):
         """Test CVaR at 95% confidence."""
         cvar = metrics.conditional_value_at_risk(
             returns_with_outliers,
-            confidence_level=Decimal('0.95')
+            confidence_level=CONFIDENCE_95
         )
         assert isinstance(cvar, Decimal)
-        assert cvar < Decimal('0')  # CVaR should be negative
+        assert cvar < ZERO  # CVaR should be negative
 
     def test_conditional_var_worse_than_var(self, returns_with_outliers):
         """Test that CVaR is worse (more negative) than VaR."""
-        var = metrics.value_at_risk(returns_with_outliers, Decimal('0.95'))
-        cvar = metrics.conditional_value_at_risk(returns_with_outliers, Decimal('0.95'))
+        var = metrics.value_at_risk(returns_with_outliers, CONFIDENCE_95)
+        cvar = metrics.conditional_value_at_risk(returns_with_outliers, CONFIDENCE_95)
         assert cvar <= var  # CVaR should be <= (more negative) than VaR
 
     def test_conditional_var_empty(self):
         """Test CVaR with empty returns."""
-        cvar = metrics.conditional_value_at_risk([], confidence_level=Decimal('0.95'))
-        assert cvar == Decimal('0')
+        cvar = metrics.conditional_value_at_risk([], confidence_level=CONFIDENCE_95)
+        assert cvar == ZERO
 
     def test_annualized_volatility(self, returns_with_outliers):
         """Test annualized volatility."""
@@ -233,37 +246,37 @@ class TestRiskMetrics:
             annualization_factor=252
         )
         assert isinstance(vol, Decimal)
-        assert vol > Decimal('0')  # Volatility should be positive
+        assert vol > ZERO  # Volatility should be positive
 
     def test_volatility_single_value(self):
         """Test volatility with single value."""
-        vol = metrics.annualized_volatility([Decimal('0.01')], annualization_factor=252)
-        assert vol == Decimal('0')
+        vol = metrics.annualized_volatility([ONE_PCT], annualization_factor=252)
+        assert vol == ZERO
 
     def test_downside_deviation(self, returns_with_outliers):
         """Test downside deviation."""
         dd = metrics.downside_deviation(
             returns_with_outliers,
-            min_acceptable_return=Decimal('0.0'),
+            min_acceptable_return=ZERO,
             annualization_factor=252
         )
         assert isinstance(dd, Decimal)
-        assert dd >= Decimal('0')  # Downside deviation should be non-negative
+        assert dd >= ZERO  # Downside deviation should be non-negative
 
     def test_downside_deviation_all_positive(self):
         """Test downside deviation with all positive returns."""
-        returns = [Decimal('0.01'), Decimal('0.02'), Decimal('0.03')]
+        returns = [ONE_PCT, TWO_PCT, THREE_PCT]
         dd = metrics.downside_deviation(
             returns,
-            min_acceptable_return=Decimal('0.0'),
+            min_acceptable_return=ZERO,
             annualization_factor=252
         )
-        assert dd == Decimal('0')  # No downside deviation with all returns above MAR
+        assert dd == ZERO  # No downside deviation with all returns above MAR
 
     def test_downside_deviation_empty(self):
         """Test downside deviation with empty returns."""
-        dd = metrics.downside_deviation([], Decimal('0.0'), 252)
-        assert dd == Decimal('0')
+        dd = metrics.downside_deviation([], ZERO, 252)
+        assert dd == ZERO
 
 
 class TestDrawdownMetrics:
@@ -274,36 +287,36 @@ class TestDrawdownMetrics:
         """Returns with clear drawdown pattern."""
         return [
             Decimal('0.05'),   # Peak at cumulative 1.05
-            Decimal('0.03'),   # Peak at cumulative 1.0815
-            Decimal('-0.02'),  # Drawdown starts
-            Decimal('-0.03'),  # Drawdown continues
-            Decimal('-0.01'),  # Drawdown continues
+            THREE_PCT,   # Peak at cumulative 1.0815
+            MINUS_TWO_PCT,  # Drawdown starts
+            MINUS_THREE_PCT,  # Drawdown continues
+            MINUS_ONE_PCT,  # Drawdown continues
             Decimal('0.04'),   # Recovery starts
-            Decimal('0.02'),   # Recovery continues
+            TWO_PCT,   # Recovery continues
         ]
 
     def test_maximum_drawdown(self, returns_with_drawdown):
         """Test maximum drawdown calculation."""
         max_dd = metrics.maximum_drawdown(returns_with_drawdown)
         assert isinstance(max_dd, Decimal)
-        assert max_dd < Decimal('0')  # Max DD should be negative
+        assert max_dd < ZERO  # Max DD should be negative
 
     def test_maximum_drawdown_all_positive(self):
         """Test maximum drawdown with all positive returns."""
-        returns = [Decimal('0.01'), Decimal('0.02'), Decimal('0.03')]
+        returns = [ONE_PCT, TWO_PCT, THREE_PCT]
         max_dd = metrics.maximum_drawdown(returns)
-        assert max_dd == Decimal('0')  # No drawdown with all positive returns
+        assert max_dd == ZERO  # No drawdown with all positive returns
 
     def test_maximum_drawdown_empty(self):
         """Test maximum drawdown with empty returns."""
         max_dd = metrics.maximum_drawdown([])
-        assert max_dd == Decimal('0')
+        assert max_dd == ZERO
 
     def test_average_drawdown(self, returns_with_drawdown):
         """Test average drawdown calculation."""
         avg_dd = metrics.average_drawdown(returns_with_drawdown)
         assert isinstance(avg_dd, Decimal)
-        assert avg_dd <= Decimal('0')  # Average DD should be non-positive
+        assert avg_dd <= ZERO  # Average DD should be non-positive
 
     def test_average_drawdown_less_extreme_than_max(self, returns_with_drawdown):
         """Test that average drawdown is less extreme than max drawdown."""
@@ -314,18 +327,18 @@ class TestDrawdownMetrics:
     def test_average_drawdown_empty(self):
         """Test average drawdown with empty returns."""
         avg_dd = metrics.average_drawdown([])
-        assert avg_dd == Decimal('0')
+        assert avg_dd == ZERO
 
     def test_average_drawdown_duration(self, returns_with_drawdown):
         """Test average drawdown duration calculation."""
         avg_duration = metrics.average_drawdown_duration(returns_with_drawdown)
         assert isinstance(avg_duration, Decimal)
-        assert avg_duration >= Decimal('0')
+        assert avg_duration >= ZERO
 
     def test_average_drawdown_duration_empty(self):
         """Test average drawdown duration with empty returns."""
         avg_duration = metrics.average_drawdown_duration([])
-        assert avg_duration == Decimal('0')
+        assert avg_duration == ZERO
 
     def test_longest_drawdown_duration(self, returns_with_drawdown):
         """Test longest drawdown duration calculation."""
@@ -347,7 +360,7 @@ class TestDrawdownMetrics:
             assert isinstance(end, int)
             assert isinstance(magnitude, Decimal)
             assert start <= end
-            assert magnitude <= Decimal('0')  # Magnitude should be negative
+            assert magnitude <= ZERO  # Magnitude should be negative
 
     def test_get_drawdown_periods_empty(self):
         """Test get_drawdown_periods with empty returns."""
@@ -371,8 +384,8 @@ class TestPerformanceEvaluatorIntegration:
         return PerformanceEvaluator.from_returns(
             returns=returns,
             annualization_factor=1,  # Annual returns
-            risk_free_rate=Decimal('0.03'),
-            min_acceptable_return=Decimal('0.07')
+            risk_free_rate=THREE_PCT,
+            min_acceptable_return=SEVEN_PCT
         )
 
     def test_all_new_metrics_accessible(self, evaluator):
@@ -420,13 +433,13 @@ class TestPerformanceEvaluatorIntegration:
     def test_backward_compatibility(self):
         """Test backward compatibility with HistoricalPerformance."""
         from plutus.evaluation import HistoricalPerformance
-        returns = [Decimal('0.01'), Decimal('0.02'), Decimal('-0.01')]
+        returns = [ONE_PCT, TWO_PCT, MINUS_ONE_PCT]
 
         hp = HistoricalPerformance(
             returns=returns,
             annualized_factor=Decimal('252'),
-            risk_free_return=Decimal('0.03'),
-            minimal_acceptable_return=Decimal('0.07')
+            risk_free_return=THREE_PCT,
+            minimal_acceptable_return=SEVEN_PCT
         )
 
         # Old metrics should still work